@@ -0,0 +1,127 @@
+// GENERATED by tools/generate_images.py. Do not edit by hand.
+
+import 'dart:ui' show Color;
+
+/// Build-time facts about an asset, available before it is decoded.
+class ImageMeta {
+  const ImageMeta(this.width, this.height, this.dominantColor, this.placeholder);
+
+  final int width;
+  final int height;
+  final Color dominantColor;
+
+  /// Base64 PNG thumbnail; decode with `base64Decode` for `Image.memory`.
+  final String placeholder;
+
+  double get aspectRatio => width / height;
+}
+
+/// Image metadata keyed by the same paths as the `AppImages` constants.
+class AppImageMeta {
+  AppImageMeta._();
+
+  static const all = <String, ImageMeta>{
+    'assets/images/categories/category_conflict.png': ImageMeta(512, 512, Color(0xFF52B7AA), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWbdGmnhG6pnpDLl4X97cn+/v5Ut6pCWFmUlJSt3NbPt6/R2tb55bjp5+c6JS1ZSFB4ZmNgu6pzwKyFY1nLo5LJ1qbD5eE9MzBLOUFHfnpkPTNoQDVlVlx7jYZgr6GHbWMnb9ktAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABgSURBVHjafc/JDoAgDARQXCg7qIj78v9/qSdtiXGOL5k2w3gW9g1OakeAjUtDoFmZziqFIaAPgB5DX857Rd5G740aEGxBwJ0XghTQJgSTEW3qEER+dgDqgdpya8nRn7UXqdcHERolCm4AAAAASUVORK5CYII='),
+    'assets/images/categories/category_conversations.png': ImageMeta(512, 512, Color(0xFFF4EBE4), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWbn5lunp/hlGHcq5XdyrzbzMaijG7TeDkwfoAtkpB2emWGSTaafl/9/Pzz6+Xr2tDlyrru5NzPlnXLq5nY1dRuaGCyd1XHnYnZva/1iTI9W2Yuh4dAXWhvWFB+kpGBeXNRCgiaAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACJSURBVHjajc/HDsMwCABQvLsMxiN7/P9f1nGiHqoeygk9hgD8V8DfwIz8AQV4pHndTzDPrvces+5W0yBJZWsdMKprZINMSJmlCw3gLoQgzVqO8gB8zAJESlaOo+PWcZv3Psbedi62kaGUCYhgKiU10ENYtgpLGM6lwYS6Q8VXTa7TkZEIPf587g0GyA1gyqjs7gAAAABJRU5ErkJggg=='),
+    'assets/images/categories/category_dating.png': ImageMeta(512, 512, Color(0xFFF7E5DB), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWlm5updF7e0tKepXjjczvnsZbKeVrmjV/+/v7v6eXRt6nw5ttreI6XdmnbxL3b1dBZcpidhHmnh3qrmnm3q5uhvo/Fi3DXn4TNqY7V4cVKPzpJQT1dbodBdaeYbWGVh4B7qu4hAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABoSURBVHjalc+3EoAwDANQJ6HYTqUldP7/L1kIxzGBxnfSIMBX4DOQfEGJRA/YLeG8UAbtRGIUVt/AIjJCg9MF5JQiXxeJcmPsup5jUeXG0AdjmzUcwwUlOwOwMY954mULrZFe//py5wTsdQl+PhTZzQAAAABJRU5ErkJggg=='),
+    'assets/images/categories/category_debates.png': ImageMeta(512, 512, Color(0xFFE7EAFC), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWblaScZl9yk6mVks7MrKh9lMepfoGVcs6ZoWSvz5vEfWrSjnf+ypze29/+/v7R2/Xj6fva4/lPh9x2o+1sm+WFrOisoarNyNLyuZHj3eeLsvH9yajz3NNTNkJvZXhug7ogNpJYAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABzSURBVHjajc83EoNADAVQLTjhoLTZYHP/W3oHRGMaVKh48/+MBPg3cAyEiHgHk8gG6ZuZa6HLaYXXx7XNRI/7CtW5tNTLaJXhBi085fFpAF0XhWOfisFZg0f0QcFg1hAQ316vW0V9XKA3qCTtThbKh577AbtIDqOk3TREAAAAAElFTkSuQmCC'),
+    'assets/images/categories/category_interviews.png': ImageMeta(512, 512, Color(0xFFD4F3FD), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXksZqfmZ7Yi2VkV19mdZCgdWahzZ/vxaI5a4ZdPjp0iaezusS72+3f5Mv7/f3V5Ozm6+5sana8xM7FyM/u2MlRaYylqLK01dOxlYrSuKvZ2NrY8/wsS3g3U3ShxJDRlnettdiLAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB7SURBVHjajc/JDsMgDARQQ7amC8aYnSz//5etAlGlnGJpLk9zGIO6HNyG8gt+ToB8INsGYojvUlDM1MCCHRHHQXYNOOUthC3vvoLuH07rEITv9QHolhinKe1EWBtu6chakES1oYxwq1YgvTl3mOfKmMD8lxrP+OKbz30BzTUOzeK2x9gAAAAASUVORK5CYII='),
+    'assets/images/categories/category_phone_anxiety.png': ImageMeta(512, 512, Color(0xFF49A79D), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXaspvf1tOpsbeizsnwuEr+/v5JpJtZq6LtpHZoOChytq+ul4+zopXSmnXXpHLkq4rvspHq2dBJn5Rqm4mIUjmJWkaEu7jN5OF7UUR1mKJio5hiraaETzeaYESdgHaTq5vd5XP+AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABsSURBVHjafc/bCoMwDIDhdG5pas/a6s57/7ecgmmG4H5y9RFCC5ddcADwrjb/gDJLVyVgn/VVjBU4eQqxuAY5RA+JcoN4ppQI5Ki7OSJ/nxlm/ExjGHFi6HHAdTQDcl3b2Orl6XoJ9ePP56QvCQsHaQjRsUoAAAAASUVORK5CYII='),
+    'assets/images/categories/category_presentations.png': ImageMeta(512, 512, Color(0xFFC9EDFD), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXasJNOnKSNpKql09Hr3dNxW1KScWaoxa7vomgrkpptsNaMgX3+/v644vh8yfPn6uvZk2Xb8vzJ6Pez2+3Q19XvnGzptpXnyKdSXGh7UkOJm4WRts+U0/aqnpfPjWH9nE4RG20CAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABxSURBVHjadc9JDoAgDEDRgigOYCuDOHv/W+oCDRr9STcvTQOgXsEXGB0zEZb2rD5nidDZTOdj4Xa8QGtbwGhkFwG97zlwl92wlxOT1TxfRxXQtk3M3htKBaCcpQ8LgZohhd7T+oSSVi4SQCEQ3f/nHh0EAA0cKGu4nQAAAABJRU5ErkJggg=='),
+    'assets/images/categories/category_public_speaking.png': ImageMeta(512, 512, Color(0xFFFDE298), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXhz5eepqvcq4ddX2o7Pl8eknZgq3ijw7kcYGlzkImRfGm8pXu+ucH+/v742I787cj84Zn98dP95rF4boB9eo/90XMlYGxCOVdQZo6xmniovK80Q1ssTGEvVGccXGYXo2/qT1xwAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACISURBVHjabc/HDsQgDARQY1K22vQESPn/vwzZFC47kqXRO4xk+P6imfXR4D9oVaIrGFIxEpkbPKGUL/IXsFdvxKg8n2A8xq4D8OYETYTrikS6jkLbgqqjTDCOZLgCFwC+oU/iKaVIqT9AhLBMy2OaQxA7fIZ5mJqcm1xKKiCss87Z/ZwV17c1G1vXDk+PhrmvAAAAAElFTkSuQmCC'),
+    'assets/images/categories/category_social.png': ImageMeta(512, 512, Color(0xFF258C8D), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWpcZ3j2tyWaFVylltjmaSfo6niqGIiWoTYrJvv0ahiZpKdj2xkRzpgUUqGSja2zdHolzU5MCwgSGJ0Oypfjz23pMzSt+b+/v0miIjRyMslVXdPc4xwRJqzkoTcp2/369LyRLrdAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB6SURBVHjajc/XDoMwDAVQj0zC7Mok/P9fgppSVX3Cj0fX8jX4v4HrYPEX5CA9vkxsEO9jPywSYCV8wzoaol4SGGdbgowlh0dCtJWNeVbK1jkE0eDhalVKcQihXWHOWm7QnQmfb0kLLAdMnx5d0hpLSdO3GIoc4XnxuR0PxBLcpRbYGQAAAABJRU5ErkJggg=='),
+    'assets/images/categories/category_storytelling.png': ImageMeta(512, 512, Color(0xFF97BA66), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWpnWKto6Her5Xy1bBtbnV5k2ZroKufYz2ccVe5yqrT1dS92eXLkXP9/f3q6NfX5NSVtWjX2tDp7Obw2cfO1LZTh5d1mlx7onCJrGGqu4+ty8y73NbHzq3b7Oc+hJxSkZd3YzP6AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB4SURBVHjafc/bDoIwDAbgbgMUtOthAznK+7+lGnBMY/wvevGlTVvAr8BvUKUP0MsUHdGUwHuPSq+6QRMETdGgizv40aG9GhR5Ay1LsDOFkLbYsWpXHrI7qtbcoTu2wOlclFBq6uCnANyOEea+5y4DmWM91PLnuSwPKK4Ncvfr2igAAAAASUVORK5CYII='),
+    'assets/images/characters/character_alex.png': ImageMeta(512, 512, Color(0xFF375A9A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWEosTpsJW5oJ7T1tz+/v40VpN9lbjl5+uDlbiuqrNmirO8loo+P1ROb6J9Y2eTfn+agH6Ypr+wi4CwtL+jsMe3wdLEnI3UppLFs7HBytpESF5TWG1Scp9ScqB9ocaLj59WVKoGAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABxSURBVHjadc9JDoAwCAXQOgClVes8D/e/pVVjRBP/AshbQFDxJ+oHok2TBBqTZCIBnFubs4DKtq2tBPRdEHS9XOrK0r2ucJaxACqQQyzohhpgMWYGqC8gAEhXlfpGJzR+AmOO2pwwaNSo0Bc9/D/3ZAeGhQavkUKGhAAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_aria.png': ImageMeta(512, 512, Color(0xFFE6A589), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXW0daYm6kpICBWV22iNETTj4ipKzuWZ2fOV1g5N1BNKCt1d4m1h3m1t8HDMUE/QFhWPFDQhm/+/v6pJzhLRlq1SlfipIlSU2rYmINqU1PHe4XXlH3UnaXs1dh1XWSbITWf529nAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACKSURBVHjaXc1XEoMwDARQuWF6imQbV+5/yxAIJol+VvNmtILn38AnGPsBJgS56QsckS/uAiBRoiWowMiPoy7TCTBQtDZqVsHRsk031BNxI6WoY1epu8eHvEohSb3YViY4ICNia227Rd4hrYiN98bgmnZQG0jOGzSNOjoC4sz5jCacX3IwfW9Cfu8v3qIQ356Lz5IAAAAASUVORK5CYII='),
+    'assets/images/characters/character_avery.png': ImageMeta(512, 512, Color(0xFF42B6A9), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWtimqVraKrxKjRsJLF6OT+/v5Gtqk7saVXVFT3wpvM1tA2rKNxammqeUqhpqjMxaXwuprwyaM9QEZkV052eHxuxLmBYkeP1MyzmYO1t7nJqo5FSE9cwLV5al2AcmeNj5ICcTyxAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABtSURBVHjafc9HDoNADEBRE4jLFGYGCC2F+98SlIWxIpS/fJJtGe4/wTU4fg+LhQA9d8MJ7RihfLpNgeO81mvPCiFmKTmwGQGR+bmYK1WW1p1LE1KVPDqFB5L3mMQCEZabwoSERy+FBr9Nf54z7TjDB5/7jDsHAAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_dev.png': ImageMeta(512, 512, Color(0xFF5C89A0), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX8/PxWhJxbiaBnqLXnqoxGSFTs6+qZtMLao4jc6exbk6brtJZZobFxcnpzma2MamOXk5ebnaOTrq2dxM6tzdW62d/el3zKmoHUtKjDyMTgtaJ9f4eEhY27jnqlpqwAAACJ+OInAAAAIHRSTlP/////////////////////////////////////////AFxcG+0AAABySURBVHjajY3ZFkAwDEQ7bemG2nf+/zMFhxNv7tvcZBIhfrImS5WyvCdExUS+6RhzJsrB2qFkYg46hJmJVBP8qBitHT9vp76feMOoulbm7bSAzzIJtHd2ChLeA1DuEh0JGp+iu1caEidoniPOFFIW5ioc5ssD1kARkNAAAAAASUVORK5CYII='),
+    'assets/images/characters/character_dr_nash.png': ImageMeta(512, 512, Color(0xFF8C6236), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXg3t3gnHTjtp7ry73+/v55VjWLYTcwSW/alW71pnpmVUiFXjeLaUmvi3W6oZPDtajw6uZWUVGadVird1GrkXeok4jsqYbi2M9ZS0FiTj5gTkBrXWd0Y16dgmeOjo7XimkAf2p/AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABrSURBVHjafc9HDoQwEERRE6rb2SbDBLj/LdkYgZGglm9R0hf1beIBwuDFFYRS43qFWEjpM5BSldmHd0OVwei2LpwwderLgI0H/H8tM4FCggn4cANDfYKesLAGqE1ggJm1ASGBs7ZhTSe81+5ptwakc99+zAAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_elena.png': ImageMeta(512, 512, Color(0xFF1B2C59), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWhkJCSitDYpJXOrcxVV2h6e4j9xKf+/v44Rm8dLlo4N0rp6uwfMFxLV4fTpJHHydH0uqGkpa/zuZwsPGtiU1hrbXtwc69+iKCFbmuAgo23vMnX2uJGPEhWT1tATnZYUV4/pbLLAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABwSURBVHjafc9JCoAwDAXQOjdJZ+f5/re0i2qLoB+SxYPwCWteYR9QYUkpMMQNbQI9qpr1EWjPlVInPaA7Z4zrdDyZJ+OmOW2xJrdJyzrKopDj+gAHnmV+3UAA7TC0ABRACwFSghA6wMJ9Dj/Lz3MxF9wQCVJ/fmrhAAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_ethan.png': ImageMeta(512, 512, Color(0xFF4B9B9C), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWusra9lHq6vcG/3LnD3rv+/v5KmZr5toyJy7fYpYM5Qkyu68vurYc1P0lPUlZsq6xxsLGQlpuYxse+xLTPmH3F39/e7e3+wpv7y7NBS1R7a2J9d3N1fIJ/xrKGfnqd3r7PlsubAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABqSURBVHjafc9ZDoAgDEVRnFqKOKPgvP9diiHGaqL386TJS0X2SnyAWJqYg1BFoRoGZTSVamSwkSaaGRhCTYaBQ5/jKxbRPmY71B2DvpKIsuovaAHWJJUAbYABAOSee4AhXNQe8hPqn+fuDtRIB1Mw1kaxAAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_grace.png': ImageMeta(512, 512, Color(0xFF6A9ECE), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v5nmsnMtq/q6erI2+ryuJf2xKbDqJtdlMV1o82JqsuqyOLpqo9jj7SUuNi3o6DPx8XS4fCIncSyn7m9sq3Ln4vesJnc1tUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXAIs7AAAAIHRSTlP///////////////////////////////8AAAAAAAAAADU49BUAAABpSURBVHjadY+LCsAgCEXLsvdq7fn/fzobo2RsIso9eFGF+An1kgBwcjAD7DAzsNmEBzCHxYRoFQMG0TAgVAN8kfYpeT10lHfEbvBNrotXY4AOgzESZDClGGoPyNJNjlLmvkTrWql8vn0BPzECr8CGcbQAAAAASUVORK5CYII='),
+    'assets/images/characters/character_iris.png': ImageMeta(512, 512, Color(0xFFB9A9F5), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXuy7r1qYzb1tX+/v65qfNRNTT1s5Xk2/bZpZdnS0mgkZDd1vnm4fJ6ZmW3rKy8srLGj3jLknrYrcLEquLGut3MxMTvxc7129dfQT1zUUmBXFGkeGa5iHOyn+2+qt/YsKCMdNETAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB3SURBVHjaXc/ZDoMwDETRtHhsAmHfocv//2Utmjqo9yXRkUZRXPaXi2dopis0FYAqwR3YVSaDGgc/trU2KDqXv11XGPg211pvALAGpAk8s0eaZONrnmlMz5Z0VhpQ7Aei92F4EkkEXfQ37r+bcxJElkUkXH9rfQAsjwX09AxVuwAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_jake.png': ImageMeta(512, 512, Color(0xFF55A8B9), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXYtJ/+/v6PVzXVl23rpXZWqblstMGudVWvi3jimGrLyLLls5Pn29P15dz36uJbsbhntrOcZkSNuqGJw86iZEK0tI2kwKu+3eTNjGHYqXnMsJ/prIirfGC7ln7BgVjBn4l0vbQxAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB3SURBVHjaXc9JDsMgDEBRYpsxATKPTXL/W5YFcqF/Y+ktLFs0f4k8uxrCB4bbFaAhNXQMAh7cAU4GAzuiBsNwzoiE88vgNaX0b0dj7HVZU94hiNrqsNbaArzrMdU7n4EWOR7HKBfKEFYpY1RqDbxjm5Satupb7gtRCATPhrpZ0gAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_jordan.png': ImageMeta(512, 512, Color(0xFFFCB89C), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v76x7TXR0b63dT06+riTk3jV1b4uad1SDnTiHX7tJvmY2HnhHzog4Ptp5bvzcWymZG5oJfda2vArKXetqXpfHqGVEOIYVTVVFPfg4LUk3vvmJftq6AAAAAAAAAAAADybx/VAAAAIHRSTlP//////////////////////////////////////wAAAHHg0nIAAABpSURBVHjajc/JDoMwDARQvGZP2Gmh//+dvRDJ3PDxaTQjD8O74/HwIxtYdu/9YmCqZwiTgQbrCs0AReci2VYIAZ470T1WSyH6FoaumyAzSu41JJLhh5LqHbhUoWZE3G5wSXWek37aqz//rOEDVF9UXEwAAAAASUVORK5CYII='),
+    'assets/images/characters/character_kai.png': ImageMeta(512, 512, Color(0xFF659A5C), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXYr5vnn3nT2c2hrpS7zrFfi2qJcnFkPS1/VDB6YF9vioiGWTCxjU/ny7D+/v5ll1vk2dZSLixYMy92pG/Kh2j15Njs6eRzV1SHm2dek1hyRjVviXqKWkyOh3Otclqrm5oGuxiPAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB3SURBVHjafc9JDsMwCAVQwM7cBs925vvfMl3UcVSpYYWevj4Cxp+BPyBivcENullrHQvA0M7GmCODMs2KuGt1JerdAcJaIESHzh230kDwWUpilFW/CKV8BmKuNpb+AsucMIk3fSHwxEviSeaO8GJrraByxdPDtyeUbQ4+gxejKQAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_leo.png': ImageMeta(512, 512, Color(0xFF384D7A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v7ytpg3THdoeJpyRDKRnbW1mY7P3enqq41bbZF+UkFopdOdfG+dyueozOLW1Nn4x67+1cDn6e86UHxAVH9AVYDAn5DEsKgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABdnmj/AAAAIHRSTlP///////////////////////////////8AAAAAAAAAADU49BUAAABgSURBVHjajY/JCsAwCEQ7Y7M23bf//9N6CMXc8hBhHqI4DJ34nN8mj4o3oiDGWIx4EAE7gQ1adgmU5soO7DaHFVjDHw+hC8FRjiocKcsiPF0VQt7zfKmuIpGcJm2p680PDRsCMLhCQdEAAAAASUVORK5CYII='),
+    'assets/images/characters/character_luna.png': ImageMeta(512, 512, Color(0xFF62372E), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWVbGDTrp3z3NF4k6ZJo86lj4rVj3NYMShqRDtFeaKj3fYiot+DSz2/gGXBe2H9073+/v5jOC7qpogus+75spXt6ehWwfFyUUtux+8lq+lULiVBsudvTUWr3PPd1NLW6vSAWW52AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB9SURBVHjafc/XDsIwDAVQZzQdTDuzmf//l0UQSoUQ981HlgfcvwK/wcLk+REAHxk+UBHP14vfwQIqIso7AIIhMmA72CmOyhiFld9eHUOMmchnbliH0UvGZG2M96GiLEIsLZ1aXxuCnmcdVve+I6w6Sf2s+6XF6eTKv+cO2QBNGQ/7a5EZpQAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_marcus.png': ImageMeta(512, 512, Color(0xFF9496A3), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v7RpJG3l42om6L0tpfRwrePZkmadlybnKeuo6XX1Nfr6+3FqqNSaZxleqyLpMyniHKivtWiy+vFmIjRvbTd7Pj95NfhqI4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABhYZ8qAAAAIHRSTlP///////////////////////////////8AAAAAAAAAADU49BUAAABmSURBVHjadY9JEoAgEANN2BHFBfD/P5WLMh7sW6dSk5pp+mGOH43e+zCLwCMEBNFPupNEhQTI4Y04T7CNRAMXtFxB5zOsOtJNIZMZurmsVHbbE9HadVlWa9/h4vbj2J2RV2r9e/sGTHECyrR8qLkAAAAASUVORK5CYII='),
+    'assets/images/characters/character_maya.png': ImageMeta(512, 512, Color(0xFF85AB86), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWbnp18pYCqinW5v8G6wML9/v3vq4qGrIivxq4qPEI1RksjbEdMiWRXl25ltIZeWlR5oXyJd2v4spDj6+cud1FxfoFtnXeMsI21s5DIlnzPnYHa5uBLW2FpZ2NmcXN0gYRn0GDPAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABySURBVHjadc9HDoNQDARQQ4Lt3xu93v+WEAkkK0pmMYu3sDXQfAX+QKdXkNAppdUhQKswBy1gS9NcJwEJr0wCdswZQcALEMNbQOGMLN6ypXEkyw8wuT7G3hHfMETfGtP6ariBrLHeO+PouVGWTy/l59oT/xkH6Q3rQMsAAAAASUVORK5CYII='),
+    'assets/images/characters/character_morgan.png': ImageMeta(512, 512, Color(0xFF2C3F63), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v4tP2LtupFLRVfo6OnKYCspPF45S2uZobOusr2wtsTd2tjkwqXh2NDFWidhb4qNTzq9Yzi2o5nEgWDVrZHCr6DQs5vHzNXpv6rr0r8AAAAAAAAAAAAAAAAAAAAAAAD12aqPAAAAIHRSTlP//////////////////////////////////wAAAAAAAIFFuMMAAABtSURBVHjajY9RCoAgEAV9WlqaVppW979oW0Zs0EfzIbxhGVCInzTONa/tnfPceEl4JvaB2JmQF7xRlqW8qjHnyPc4pzSPz1wNphAmmPUOGGjVtkrD1EwH4BQK6G6hSQRFJ1UI29t+2+ixX988AJKoA4Sl7zQZAAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_nadia.png': ImageMeta(512, 512, Color(0xFF543476), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXi0OTjo45ua3p8eoefe3a5nJf+/v5SMnWLdaM2MkfYyPBXSVbs6+74s5qGaGmpp7DHnJDGo5v7u6BEPlCGhJDh2O0wK0FeQX9kR4F3WZahkLOpksW3rMCzsrq9u8LKyc5tt9h/AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACCSURBVHjaXc/XDsMgDAVQ0hFj9swe//+XgaaA2vtgy0eyLJP+L+Ru+ql/4IGIPDQ488zxrLAjf0nj9wpBWWPfKhQQ2FljbIeigOdOSsd9gV4Pyjk16Hb22KTcjnpWLNNKyDotZYUCUMZy/cIIMEc2A4w3REhhLNf4AUJT0koKqd+2XP5cCXzedbo2AAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_omar.png': ImageMeta(512, 512, Color(0xFFFBB388), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v7LiW85lpf52cvl6epoPU7VknTzrYQwjpFum49ssLKVT0SXWlWOwsOsiIy6o6jTnZLA3d7jl3XxpX7707p4T16HraKKtamwcmywnaXYpJndwLfezczqs5kAAAAAAADGq0JdAAAAIHRSTlP///////////////////////////////////////8AAM945p8AAABdSURBVHjajY/JDoAgDAVpWRWQ1V3//zf1VrjxbtNkMiljo+O8x7gsR3u6VillJBZBlQynIMPBP0dOtbpobSs5DygFoc3cAG/X3TNsDXrEaUL0lJ3RGJxF66Q0/OUHfA8CvLXXVpMAAAAASUVORK5CYII='),
+    'assets/images/characters/character_priya.png': ImageMeta(512, 512, Color(0xFF39233C), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXm5Ob4r3fwq4r+/v7+6NLWh2X8xoz01sU8JjyEeIXZ1drolnH4snxpPkR1b3S7tLzVnYnWpoz2giLljWn4lDXzk0pTOkhUQFZfV2NzUlJpWGuGUU2uaVe0q7XEeV7JvrtxRQR4AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABcSURBVHjalc83DoAwEERRA845ksP9b4lo7BUV/PIVIw0aXqGv4FaBIEjODZcAnNnJdgBgynvFAIgzpR5soGkk6gIgl5kQgRuwbEOwmVXoIsWYRl1BlweK/vWldQPcVgVxIjerSQAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_prof_chen.png': ImageMeta(512, 512, Color(0xFF8D8C93), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v6KiZGwqqvr6eqzsbTKtajt0rjiyLFVZoSXm6dKVnNaYnvOzM+1lo60opXaw7De0stecIuXo7Xz3sMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABWRQvPAAAAIHRSTlP//////////////////////////wAAAAAAAAAAAAAAALESzYUAAABoSURBVHjabY1ZDsAgCAXlCSrV7ve/a+kaTDo/yoQwIfwTW+vmBoCjE5xy3tkJSYY4gUlkgjsp2RB3ZEkiafFVnueuEiwLv4A6jhXxG4mGUgaiRym9gvRasA/VtdTzjVfBUN2UwX3p5gAntgJ8rA963wAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_rex.png': ImageMeta(512, 512, Color(0xFFA8B2BC), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXr4NmbalugnpBhV1SghHa6z8LLqJZMMCh2pIhaQDlyfYljkW3ux7f+/v71tJLrp4ensbvVimyZpq15housqLHalXeteGlya2ysyLfFc1vN1s/jmXlWSFBYZV9baHBcinAe+7LSAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACKSURBVHjaXc7XDsMwCAVQr4yOAMYz+///MnFVVXZ5QRzBFWL6K/HtvRIN6GF41LDIYGQNQkYbG0BAFHXGigjNhgV4V5CdnGfzO8k8vmTSm1TdBxaiUSti9vHsCmSic/NE7P2uCnTOH0kxOWa9LyXj6UzAdJheRYsFXH+/BQAYrA0FxFomWOd7ttMF2hoNxXTVnuEAAAAASUVORK5CYII='),
+    'assets/images/characters/character_riley.png': ImageMeta(512, 512, Color(0xFF532B25), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWdjYzVlXZIX2ddlat2ss6SyOKGbGkeU2U5gJ2/gmadusbGvr7u5t/4+/5SKyUYSVfys4/p6u3M6PbpqIVkOjF5ude7sLCoyNYkVmVtQjhqR0GLXEudtb250t3IyMY4ZnY0HDtfAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB/SURBVHjaXc/ZEoMgDAXQsNk9YRUU0P//yzJThbb3Jcl5uRN4/QWOabYfMIC4PAaYFVu86TBjZh5xHrAw527LAGi3Yww6rF63+LXDhFnrjNNoAa41h9FSKG1botIhCK6U4PsJNiQKQewXe4C6EklJRCdYGe8xllq/vo1PWz/bG3GNDjjnt/p3AAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_rio.png': ImageMeta(512, 512, Color(0xFFFDBC91), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWqmZxuZ3mFW1j1pH/CloHg3+P5+fnztJFWWYzxqY07Z6lEOlBLQlfRlnpma5ixvNE2LUJzXWBqjL2bYnmasNGKzvCD0/bTo4vY19vX1OD0zLT96Nrl5OcyVJFAaaF4U1VC47z9AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABqSURBVHjafc9HDoBQCARQrMDv9q73v6UbzUcTneULkwlQvgIfsELxgNVoA15AEoLWJsJo2KaHHuNFBTYfKlGxOCBaAQsi4yJnZ8RZzk4NZ80UoSbH7Ki+wSvau86R8he0ira+J1Ltz3MxJ1D1CHh6YrNHAAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_sage.png': ImageMeta(512, 512, Color(0xFFDDB280), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v7Uqnvk2dPcsYOTRzDUqJGmaVW+lnDFmnfZx7ns5+XZy8i1koh+PCieYlGri2C9qY7Jm4bRvrnZ0cnnsJrnuKP1xq+ZWEWiilizjoTZsH/ur5cAAAAAAAAAAAAAAAAcdBLAAAAAIHRSTlP/////////////////////////////////////AAAAAK/l1IMAAAB1SURBVHjadY9XDsMwDENNDVtOnD267n/PtgFiu0Aj8IcPBEE5d3Fz82PbXsS3xTe3j5e+hKL4aTeZM0helVf/yIA6fa3aUVWati1VpY7GKYxVgPAcBqAQBYfA0DwD4EPnkAhDsGCIJ2Dm+67GMZcSLV/9ffsN25YDdB73X1UAAAAASUVORK5CYII='),
+    'assets/images/characters/character_sam.png': ImageMeta(512, 512, Color(0xFF89B654), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v57qVOItFPY48r0spKVum6ewXOhxHjoqY2pa1R9SDaCTDmNWEaTaVqBr1G706LFpprN3L38zrL+0rr61sTh7NR/U0aHUDyriX67npPZm37an4HLrqT07esAAAAAAAAMwCunAAAAIHRSTlP///////////////////////////////////////8AAM945p8AAABiSURBVHjanc87EoAgEANQdwEBQZGPf73/NaXRSWNjurwiM2man7lO71eEfnFdtwHMzlrbA4y7MccIUGRNwZFsTMY+kZQ0AbQqJdVCHygEGl4RzKw1EYtHoqrAKsKIqPm4dQOfpAMABHIiMwAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_sunny.png': ImageMeta(512, 512, Color(0xFF612B2A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWhZFemlJHeraHX4+XooXGjo+U2vctPs6xRyNOvl2uYw3n3w61NHyF8W11uxJ+Ny8rHdjTAf277siTfw3X+/v5iLCttNzL0pYzt5+z4s5ZUJCQ6ws55S0mOaWjSw8PnmIptdbaYAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACESURBVHjaXc/ZEoMwCAVQsrl2b4AsJv7/X2qribX3heEMMwDYv8BWlMwnEISUxAEOPyFRwKW1A8CpQCLqpZSAYocJgZlnJsoFyM+zh0DqC/mpaR3RIeAGdvRMmh/hcnX72tH32r/autbq903KIXYVWDTGDE1U9dJ7NKbt1O9zzp2/PbIA0y0SG0mC/QsAAAAASUVORK5CYII='),
+    'assets/images/characters/character_taylor.png': ImageMeta(512, 512, Color(0xFF1B305D), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX///82SXL0qIkbMF0kOWepts/Mxs27ws7CkIHo6u5IR2pKVXp2hKOLk6r6w6xjfKmCmcG6iX+hqb3e3uX5s5Loy8X20MQeM2BLXohra4pyd4B1gp/0vK4AAAAAAAAAAADM6Tl0AAAAIHRSTlP//////////////////////////////////////wAAAHHg0nIAAABrSURBVHjajY/HDoAwDEPJaqGL0bL5/+8ECZDCDV8iv1ixUlU/JWs02mfnnM8KmB6x1xFTX9JgKohl0kcSYvq0jIijsk0Y0jHszesjcxAJzPHZE/EisgHRnbFEM3QdAJO9AQD4tvXXsH/ePAGmKQNUCxZSJwAAAABJRU5ErkJggg=='),
+    'assets/images/characters/character_viktor.png': ImageMeta(512, 512, Color(0xFF2B3751), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXj5OikjYThn3b+/v4pNU7VlnO6g2hSW2Y6Q1aJh4yUm6fopHqtdWC1mYy1tbnHjW/RvrbxroIgL0lCTFVzWlBuZmprc4OBeXnHfFzKxsbf3dvc3uDf4OL0sYTgy8L4597x7tG3AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB/SURBVHjaXY8JDsQgCEWdqeBardN9v/8tq2MaaX8IkBc+BFa9xHKZlZopaLDrrCOgDvtuPhSg+WJdwAkAHuAsExCMCUAsRxyB43HFe2wKcP1k7dS7DDYlpBwRRymF2iJYeZSISnVNFp26tk1Z5x2R/P6h76XLwLnkw0K+rdjdXJbNBur53wR0AAAAAElFTkSuQmCC'),
+    'assets/images/characters/character_zoe.png': ImageMeta(512, 512, Color(0xFF71413A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXklWOvo6h9mp+fZlChf5SousG51tR9YV+8gF/Cub3+/v5uQTtwSEXU0tfwpGw3tpc3zKGFWVDRjGLq6+56ZnCll5m1q7A2m40zpI441KNKvaBgNTF0jI2NaYKJdHqwdlqOI1XvAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB6SURBVHjafc9HDsMwDARAyi2FxeqO+/9/aR1kJTCM7IEA57AE4X0J3ANHReb1BSZMIS6g0lYbDAU22kGs2U6IWAeQ8KSYQaEBENhJZWAk8V4QOYOj2Vv7mMmdpa5tLDStK1c6vazrorsC06iHQY9Tgf7TV1Uaf577yQEWDQvDJWtd0gAAAABJRU5ErkJggg=='),
+    'assets/images/mascot/mascot_analyze.png': ImageMeta(512, 512, Color(0xFFA1CC69), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2Su2iZxWauy42iyW3V5M9wm23k691ql1l2pF2LrpWJs12205PA2Kfm7eB/ooiKi4iqur2518HIv4PF3sjH4acAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAazvmyAAAAIHRSTlP/////////////////////////////AAAAAAAAAAAAAJ0wL0oAAABcSURBVHjanY9JDoAwDAPrOOlK2fn/VykSBc5E8mHsRJGd+zuVrF9WUUnexs7UQf26T8+CHLP6xXznIBsRc47hNkZRFAESb8MgAm1CvxlYLuTnL0i48LK1kPa31QkIewHAQ723mQAAAABJRU5ErkJggg=='),
+    'assets/images/mascot/mascot_celebrate.png': ImageMeta(512, 512, Color(0xFF9ECA67), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX9/fubx2ekyHKSu2SpyIfE2a7s69rz7vCLtV660qL+9tpsbmqo0Ha314/HvoPAzpfQ3sLL4LLc5tLf7foAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABkmr7AAAAIHRSTlP//////////////////////////wAAAAAAAAAAAAAAALESzYUAAABtSURBVHjajY5JDoAwDAPjLKULa/n/X2mJygFxYA5RFFt2iD6ZiM4+3uQhZzJVc2cjUMBNXxu7mPICLKwme78w4yjzXAzMHqJYN5FthU7BQ5sUI7M8dclDUx4tNQoQRYehIgVT8dIH2Ovtg/5yAUjaAjaOVtlNAAAAAElFTkSuQmCC'),
+    'assets/images/mascot/mascot_coaching.png': ImageMeta(512, 512, Color(0xFFA2CE6A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2axGeuy4yhy2yTu2V1glrE2q3l69691aJtb2u5tnvb59BQY15VaGNrbll9d2aAeGKMjVuJl1iMuV+2r5u81p4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACa8nNaAAAAIHRSTlP/////////////////////////////AAAAAAAAAAAAAJ0wL0oAAABXSURBVHjanY9JDsAgDAOxSVi7L///alFVoGesXMYHj2LMaBzp/mzfdCaIcmyFhAjEIJW9TRRhgq+LsBDZ12X7mhslVudJQ5OewKF6dY+QYnznXIzMo189zW0BphhA3AAAAAAASUVORK5CYII='),
+    'assets/images/mascot/mascot_empty.png': ImageMeta(512, 512, Color(0xFF9ECC68), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2axmejy2ysy4yRumjA1qjj69rW48mKuV2m0XO42ZDGvYF3eHWJpGivsK6/1arBz5nE0pvH4aYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFG2QVAAAAIHRSTlP/////////////////////////AAAAAAAAAAAAAAAAAIz8QSMAAABZSURBVHjanY9JCsAwDAMjr1m6//+xdQMhOVfgw1hGwin9lTLrygARaDKXSlSJ58GzUTl2DDa0C3I3WEfHGQkSkxX++QpBl0BtpMYqCy+9wizJJnuY7H+/egHIagFzwCbkhQAAAABJRU5ErkJggg=='),
+    'assets/images/mascot/mascot_encouraging.png': ImageMeta(512, 512, Color(0xFF9ECA67), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2bx2esyoyQumSlyWzZ5c7E2bCNtV5sbWmo0Ha32I/HvoLAzpbG4KW40KHj69wAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/IgbHAAAAIHRSTlP/////////////////////AAAAAAAAAAAAAAAAAAAAAKJWeS8AAABXSURBVHjanY9JDsAgDAMTO2Fv+//fFhUqOOObpfFEETlNAMLe9cvqsKJaDIIfuFLO6dIQx861NrJVJcM0mMVoRpcJYEjvafAuo3Ye210ClGf1Dgn89KsXuRoBVPZaCokAAAAASUVORK5CYII='),
+    'assets/images/mascot/mascot_error.png': ImageMeta(512, 512, Color(0xFFA1CD6A), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2gy22ZxWatzI6SumbE2qmn0Hp9fnu40pi50aLb59Dj69y/v37Q38EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACMdgzkAAAAIHRSTlP//////////////////wAAAAAAAAAAAAAAAAAAAAAAACuQmcAAAABSSURBVHjanY9LFoAgDANpkoKA3v+6ivJxzeymTfNeQ9jFSf+7vVzTiebAMQbwFGNynf2sWqTECPVIRsubiaNSX0deFRSgGWiIVKjLy7Nk2f3qBpvWASi8rf0zAAAAAElFTkSuQmCC'),
+    'assets/images/mascot/mascot_happy.png': ImageMeta(512, 512, Color(0xFFA1CD6B), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2iym+ZxGetyIuUumvE2K3j7Nx7fnC+yLKq0nq52ZK60qPH4KfW48rJv4XIwITo7+EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADSCkLrAAAAIHRSTlP//////////////////////wAAAAAAAAAAAAAAAAAAAK8nQPgAAABfSURBVHjanY9LDoAwCERhBmpr6+f+pxUbrYkr44QFQ+ABIn/lpA+TRLSrpyE4ddYIOnqBijaVMjUo5aqsNOMG3hSo5WxqA1txMlGfrWZADA2vWDxsejr24CyvW9Pnrw66pwFjfWwJwgAAAABJRU5ErkJggg=='),
+    'assets/images/mascot/mascot_impressed.png': ImageMeta(512, 512, Color(0xFFA1CD67), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2iy2qYxWOtzIySvGeKqVvFx4zk6911d3OMuV6q0na42Y660qPB2afG4aXb59AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD05yQBAAAAIHRSTlP/////////////////////AAAAAAAAAAAAAAAAAAAAAKJWeS8AAABRSURBVHjanY9JDgAhCARtGnAZHf//2zEmo56tcCnWEMItjWynY7KdeDCCKyFvKiW98nsUdzN3iasDMAN0jVSZ1GNrVs3K466SGuL2Porst199s+MBVA08NNsAAAAASUVORK5CYII='),
+    'assets/images/mascot/mascot_premium.png': ImageMeta(512, 512, Color(0xFF9ECD66), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX9/fyayGelyWuty4/Z5cyRu2Wm0XLGzJDs162Mtl1sbWm32Y++1abHv4HG4aXz4rnitljwyGPj69zv7+H7894AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACMtLjpAAAAIHRSTlP///////////////////////////8AAAAAAAAAAAAAAIcLvOAAAABhSURBVHjalY7JDoAwCESZAq3drNv/f6toou1RX8LhwUAg+shkDNoorEvY2+MHwRnoCfYZyJ7fBubkfZqfSBHUoBoqpFwuDnYiRis4uSPCuGHpVxVQ5eETZVbauosNh4WfnC9SAejwHt1QAAAAAElFTkSuQmCC'),
+    'assets/images/mascot/mascot_speak.png': ImageMeta(512, 512, Color(0xFF9DCB67), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2ax2Wty4zl886kzG2Tu2es03Tc6c652JTC2ajL4qnj7NhtbmpyjFCNll7KzJKMul/Hv4IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACrs1NzAAAAIHRSTlP///////////////////////8AAAAAAAAAAAAAAAAAALN0qXIAAABbSURBVHjanY9JDoAwDANjJ+neAv//LAgqlXPn5lFkKyK7ZDL/s+HBVqYlQzKKToHSQmjFdIqKi70fRyhaXxHhGMMs6DzJ+KDG2ZHowOmrVMRJl7p2I5/tuPvVDeieAbLpTHVBAAAAAElFTkSuQmCC'),
+    'assets/images/mascot/mascot_thinking.png': ImageMeta(512, 512, Color(0xFFA1CE68), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX9/v2jy2yZxWTj6tyTvGWuy42o0XPU3MzD16zn7uFvcGyHq1mJtl252Y/JwIPC0JjH4abf6Ne50aIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABON34LAAAAIHRSTlP/////////////////////////AAAAAAAAAAAAAAAAAIz8QSMAAABhSURBVHjanY5JDsAwCAOxgWxdkvb/j+2iKk2vHZkDyMIWGVD5kPXSwPbMTXJPqqL52XGTutnDAizB+4GthFAaexrWalZX9gyC0wTY6yBp4P4+5TzTzIdS5m5j84h4Sn5yABz5Ad730G/SAAAAAElFTkSuQmCC'),
+    'assets/images/mascot/mascot_welcome.png': ImageMeta(512, 512, Color(0xFFA1CD6B), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX9/v2iy22sy4yYxGeSumba5s7GxYzB2Kptbmuq0nq52ZLH4afk7N240qLC0JkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACmtGAAAAIHRSTlP///////////////////8AAAAAAAAAAAAAAAAAAAAAALrsT2EAAABWSURBVHjanY/bDoAgDEO3ttxE/f/PFQUMzzTbw2maNTPbVQLSyv7J7BwMP7wNEofBmkvJlY7OweMtxUjMAN2ltoMDwfcmr2nAQFLC0itAf2kPGcLuVw+rbwE46ZEx/QAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_conf_1.png': ImageMeta(512, 512, Color(0xFFDACBC5), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEVSbpVzbF1dj52vm5S81s7kyay2473gt6PFvsH9/fzT1tXr6OevqqrQycZ1mpi3s7WxusbHta3x6Nc3q5mSlpaHkKT08taRhomw1s3ZyanY587W7OfluYk7YZQ/sJxVZH2wxwCgAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABxSURBVHjalc9HDoRADARAk7HHZiI57P9/uYghSNzoY6lbsgFfgU/AdIFo7LCbksQcoLS1DvMSl8VFyIrKTTPiWMSJ6tt9QjRufo4AkBo3DKn3d4Nr0ixNc0L4tWtusweUGDB2b4TzDiIKTCLMn3858gfXBwsNCdNrXgAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_conf_2.png': ImageMeta(512, 512, Color(0xFF357DB5), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXfsY01iqtbpqaju82jxWbN0Kzg2dFws2Rel8BJw7tgx8Kko6CvyrGzzuP+/v7U5uzY6tCtyNn0snQzmKL85tA5vbVJiLdrmLt2o8V2tU55vKyQyWTxhxn9xJj82Ljo8txOpBBcAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABrSURBVHjalY9JDoAgDEXrhDMUFAREvf8txUhj4o4uftPXGfjPIAesJ4G5MCLGIagE7AhVdEoR2AAqdvLjoBbh/TCtvKkxgV7rJ1fvewJYLlEv1zpauxSPbqahGW+F7SQBJgUil1J8l2LGcze/pA6So5LKnQAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_conf_3.png': ImageMeta(512, 512, Color(0xFFF9CC98), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXg5tjtzZzWspTno2eijXijrqqx0q2g3dhCb4l9n51SzMObZEf+/v701a336dXTxLd10ciFvaTJuKvl3NXr5eJVfItX0MeIlZH1t3HtyKZCv7eDqo2YxZittK6gxJPWt5ammYlJAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB7SURBVHjajc/JDsIwDARQJ+kGxHaWZuv6/38JaihSOXWOT56RDPovcAuAG7jA6F7Kay3wB14WrylnOjdgWzqArOC86LbFmF7J/gtOz7OZpqY1FYh5CDHG9HjCAUWIEKy1KVlxgMCxXT2zc4S1glhY7usukeroR2ro1nNvwzENCA6pGfoAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_conf_4.png': ImageMeta(512, 512, Color(0xFF46ABA7), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWuqJzqlVDQsZigcWGth17Nf0Pu4NT+/v70pFzUiU7VqpXa1NFRlY6ph23s5+RGqaVpinnOkWpKop1rlYiHh2uWhIWWmnLHrqHMxsflpojn1slhR0t5UUp5ZGeerLaXu7jAGmFzAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABmSURBVHjalc/HCoBADEXR2E0y3bG3//9LYUR0XOldHsiDQPUKvoJaZ46gzZY2gn4c6QnERNGGlaJpJujUBUZorXfv+QRmME4I18vzZBoGmUNquk2WAQixQGsxQUwDqPoqUT9+uTsA2TIJGfa/IwsAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_conf_5.png': ImageMeta(512, 512, Color(0xFFFEC4B2), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWan6Sby9bh3NyW1bdvvq6Ae7/Cn67Bv8z+/v7p6/Dqt6sxxsLV2uiOtbO0pq/NnIzXo4zVtrD9w7Ho2dVEt7iNl5COvdmoqc/ApqTaztA2prsxwL9OpsVBw8N/esB9qaw8tHfEAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABvSURBVHjafc9HEoMwDAVQ2ZDEX+42PYX735IVCjCT/OUbVTKX0C9w7gzj7TMCAnBE93AAUxNzxLcFmJm1kQoAavLD4JW0vK21L90IKPvsuqVp3Q4ciCcfHjKjlEwrFy1bau6pp/lwR44ppvr/OckG/BoJmJysEdAAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_conv_1.png': ImageMeta(512, 512, Color(0xFFE5EBF4), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWbpahcVFztzaruo2VWYoXotJfe4eSuuMesy6wwlYxZNyx1hnR5g5ozP004SXV6wcWiYUOyin++0dDBrcb9/f3q183y5dfn5u1xe4vQq5TZtonU1uWVmqWrqKjZwrfHzN03SV5qAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACBSURBVHjajc/JDsQgCAZg3O0yO4haq+//lmO6zGFO5ULyhT8A4F/BFQjWukUyvcIBFsUoEEnVX2R8dgjmjBiG6S0ZProtGyh6DJDa3em4QVDVDVPS2oq57WDmGwQuSfAekRRF6Vty9rQBcYwrojdZyWMtlN68zPK8Y4U+URNce+4LZS4Rtv7dH28AAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_conv_2.png': ImageMeta(512, 512, Color(0xFFE6F2F9), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWUq57k5tOgpG6aaWSp1u3k07OezqndmHjfppVmaHJQhqCYuso7VGxrfoxvizh+llhzvOPm0nj8/f7R2NHu7elxtdiMqGyryLmz2cPa6/BEY3R4jI9+lG1uoY6MnoWGq4qaCXHCAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABxSURBVHjanc+5EoMwDARQST6BJIBsfHD+/18ygw1FumTLN1vsAn8FfgFMN8hOCDasdaowAAnvXdNAATlN1jJbsRypwkZOsTJo/AVZfqDH2LVAeAFqaNUY5vcWVAE69p3W1xpqgz3kJcLsonuG5T+/lJx9JRAxtR5V4gAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_conv_3.png': ImageMeta(512, 512, Color(0xFF8DA2D5), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWrn5fk19CbdWVpYl6lk3vYqI/Xz7aZq9e4xeDmqndzlpV5Ri56waWoXzm+06z+/v6Hm8/ttZXq2sxRrYrTpI7dvJXVysasYjyyiXCxu5jHl3ft6+pbUkxVsI1supyNW0PNsGBHAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACFSURBVHjabc/XDoMwDAVQZxM67AxGEij//5ekClRthR9s6ciWfAH/Ci4BoLz77A8QixCIkt+2BmWJTiJGp3iDUTg1M8zObWM76SGO1oKUxwYaoi7b5xruB3SGjNMprK8TiEhjH8IJjPM6ICV9wvSIiH4Y/AcmVccXKKgP+Dnrn3DFs8u0O6YaDn8uU/27AAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_conv_4.png': ImageMeta(512, 512, Color(0xFFFBE9D4), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXo0bBYdJHbmWqWb12aopYuXGbfsJRXaFyup3rGVzDZ1c98Tj16hZO8VDC4zaHTdlH5wlr+/v3v28j159XYmm3XsZXsyrFKVldRaW9se3T27ONPWGVpaWWIgnWujHjUy60SyDgBAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACJSURBVHjafc9HDsNACAVQprqkDjDd5f63jOOJvYiU/BU8CRDgvgI/geiEraIVEemAuyYCwDUA0A7Qe+ucVeoSGtBqbQiLVOoDfs6ZpeIqrthGjInDIJ9aiHfnUKauuz1YzkIwblC4z1OMJpm6cNl38DxNMYua2O87itdpkeOotS/tLJ6hf88deQF/mRA0Le/0qAAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_conv_5.png': ImageMeta(512, 512, Color(0xFFF8C594), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWprqvSrJW5d2OViXK1wL+9xsLDhmrn1LvrycH+/v7s6OnnybDksozZ19Pm29driYiPem+xiHDWl27p4duLmI7LoZDZuq/hu6lahm1VmXpxQEVyUFp2h250k4CFWFqKaXAHyh77AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABnSURBVHjalc85EoAgDEDR4G7YQcHd+99SHQUdK/1Fipc0gfoVfAQ8i4CcQ0mJiMDB7nt7X4zDyhF1G2FJyD5JgQFyJRzWrQ4XVT/NTdZIKS7wXSoBtFL0AmeMYUcBBGOeHtkfvzzaAHCSCnLIlApjAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_date_1.png': ImageMeta(512, 512, Color(0xFFF9D7B8), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXdmWmbm5ahcl/cpIidw6/Z18tSSVOZj3nDZUL+/fzt2cvzlmz45tVuOjHoi1Tuxab31rr37OawiHXMvLaIVUeUvavTsZT0tpH5yZFZMzKUalivZE/alVvSxLXWxcHldlJ+wtfVAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACBSURBVHjajc83DsMwDAVQyrKTsKjLvd3/lg6saMlkDhwe/gdIwL+BR0D+u7wg0Q+8J9xRqeQqNKZBVMurwpABCB1rF24IOutIKDyOJREG1XciIzOXhMS+bd3EbK3cQO9+gGmyfJ5UKs1iN4DNftYCGI0xa55nE+vptKfjSKl79twFstALUB7Zn0EAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_date_2.png': ImageMeta(512, 512, Color(0xFFD6F7FE), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWkzKeXr6vgsZqn1tzgjXTe3NxxrY6qqHSSdGeku8donXf8fXBxUkudwXT9/v6M2/Sb5PrM5c/P8/yr5vbX2dJwtZWNxoKc04aV1tGt1Ye249XU6eRPaodVdIxXqItucnfYx6bkAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACHSURBVHjafc/HDsMwDANQSV4ZbeQVOzv//5ctbAQNiqI8PvBAwvAV+A3eMocbBG6QBYoLFttKw2dz2gouWyZlG3pMrgA8Fz3yu9XCXMAYPPQUqI/Z1MYKx+h9lMpBARRh27ynnpYKME77DkBSpgpDp3WX5kxzuoahQ1ydip/pa1RKiH/nbnkBMJsNcv4KGEkAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_date_3.png': ImageMeta(512, 512, Color(0xFFF8962B), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWhzthpoajc1tNiY2GokF7ksZboy6hNl8klbIOVpKL1lS3so25zRTVNdJV+xsOCe4L+/v3u6efx2c3TlXbZ6++z2efJt6ztqYvtx7Y2jMdhOCtpi6SHbGWQe3eRu9OytbekIHobAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB8SURBVHjajc/JDsQgCABQ3LvMAqjV7v//l201ncOcyoGQFyAA+BfwDCSVvN+wTNMlSrUV6OX9cJY1Xx1rbxiRs79HbGeNNfs2ugof3fXMEuw8mgKgdRsB4uZcLhC0agSGuVEr1x0gxAninVLdEUAOKcTly1n+TickoofPHSb+DytdmYmdAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_date_4.png': ImageMeta(512, 512, Color(0xFF957CE5), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXUqZ3lkGCmqtza2eOxy95sboePUTSkqW2ZsYZtQCx0VlVeisd8wHqUfmONctn+/v6UeuP859Tu6Op1mddyuHHOws/L1+70s5L3xqz33MyNlLeQp9mCwoCraUq5d1qsfXGxUYO2AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB6SURBVHjajc/HDsMgEATQWcAlFVi66///ZayApSgnz22fNNIs9F9wDSzrrmNdTmDMckcQ4Ap86+8xJZ5or4Ce1tlNIgCt8qJROhc1QoNleCrnlDBGfkH6wS8ex91Aj95bovw2hivIdbOELB7iHFa2QjlF9TPdHrn63Aephg55pV9fsgAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_date_5.png': ImageMeta(512, 512, Color(0xFF5496CA), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXp0arns5jy6dfvoVtkYmNceJxgiLGgiHCip7A5W4eLbVGby3Ot2I/9/f7v7Ohqlbi62OnWspfM6sz4kzD5065TY3RJZopYmMh3g5JwptGNl52MmKaVxObItrHIyc3P5vaxG0UzAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABrSURBVHjafc9HDoBACEBRZOwKU+1l7n9LXWgkJvqXL0AC0Cv4gGgIBTgwJoR1vYHBMUGIDi8Au5cbEzXtvcKbtYAsju7JGQqYpiFRIGDQelZeQK4L5T0+kFV9WhdyIuvHdBGwjN3clb/PPR0Rrw1GP1DSiwAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_deb_1.png': ImageMeta(512, 512, Color(0xFFD9DDE8), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWfnqbGsqhtm3CITz2Sb2Te2NxNVWfKjnJtkLRojsejvuehwZa+0dT9/f2Tstiaxuno7fG3yOXa4u9qpG6Puo60xtJwh6+Yrc+MuHeMtuGzg2uvu9W00e3R1dRleZBojXB0sTwcAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB6SURBVHjalc/JDsMgDARQE6DpZrPvJPn/v2wh6qW3zM1PI40M+Be4BAz0hM08kh0352JCifseCFGsK98G2BYBSUtWqxhAiSA2g+xwsLxGo5k7kdXeHXU5V6gopdH75QYnJNXLF7L7gVGjkbMDOUE+Te/WvkOAcPWXmQ9O/A3mqFiL9QAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_deb_2.png': ImageMeta(512, 512, Color(0xFFD9E9F6), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWXdGikkGbQlHCRpp2juMpobnal0+bhs5fCvcd8STp6oVHUz7j9/f3o6urQ1ta0trW5xc3z4dOxqazUqY3HydDQ2eG2k3Hx3czQlnnKu7HZ6Ov5wrNsZ2uXnqOwh22tnZmiI8AGAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACFSURBVHjajc83FsMwDANQSq5JQKpL7r7/LS1PyctkjH8ACcJf6CEUx18YpoC13BBRnRD0hNXx0mNMkrhCfp3rR7jnSL5dCJqmg2GNFTuMTQWlGyNivfWtia0Qv7Nq5syQ/fS+drA6VGcCMBvaKNYrOofdzIDYbpN0P+ZcKQ7gFIX58ZafXDCnDZtuzkeWAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_deb_3.png': ImageMeta(512, 512, Color(0xFF1794AE), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXZ4eOsmOWu39PTsZHU1bC/37bxsW39/v5zuceKxdLM6OrU5dW65ejQx890wsvR0+vn2LQnmbJIqb6JyW2QyoG4u8zHxunr4+pcr8FvuWh+w2uLctKXgeGe39uui7yhieNoXECfAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABoSURBVHjadc+3EsMwDANQyk0mqeYe9///S3sTLpdgwPAOC8h+hX5Cy33X9dxmSDqVWgCQ+EpPgGsW5+iToapVxMJiG0bnE8A6jIEaAC0kzh5AnBizA0y+NPcBEJe0RMrAzCG89f8c5gGvPgjUbaI9iwAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_deb_4.png': ImageMeta(512, 512, Color(0xFF99CA77), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWkqpDX0aGlbE3Z3NiizaTaoV6rxtjOrI1jeoNIodfOzHJqUUayjUOHwHX8/fvY587r6+a826iulG+xtqvI4bjy6c52uHSsinPSvLDRxbbV2dLq8dx4iZCNiYqKl5aUqazfrDnSAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACGSURBVHjafY/ZDoIwFERvd0Dt7Q5tWf7/LwUp0ZjoPJ5MZgH9JfgBGIvsAwSDxqDGC9hKBsSBIJ4Aa9CxlFhtcwREa4zRu8O+QPE3N04kS3IEHxl3SokSdFTyBDwLkpKivpehtYB/JCF4z1uLntc9hPoOr2Hb5hx0sFzDOGSAaVln+HPurSdqXQ3uEqgOIgAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_deb_5.png': ImageMeta(512, 512, Color(0xFF5B66A7), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWhmKLkk2B7j6Oob3Cfr9Kxw9jTqJThyaTn3NmMaoa+kXzDdFP+/v7W2eh0ha/0uJBta5bUyM1ucqaGm5TZ4+7n6/CSaXOOpqyUqNCuttHVmXfUrIn8qI1jaKB2cZeBeY0YrUtEAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACFSURBVHjahc/pCsIwEATg3aRpojb3nV7v/5ZKTRAEcWD/fDAwC8tX4CeE18UPRJgAGwsdQi1KioajIkGpasHW0GE1B10E2InFC6TZH7OwsZTML5icMwYtkJzfFX06iimhIkpesN0Pird0et9BzyuC24kH1iuIem3gjRw7tk1zrmf557mRJ9QpDOD7xXjMAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_int_1.png': ImageMeta(512, 512, Color(0xFFEBD8CA), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWVcVylpIzW5utpZmOTmmmfz6fSmWPVq5hanGBqlo0rT0NnPi97TjyGUjr+/v7p2s/v6OW35vTallnVrIvPuanSxbfmyrUzR2uNq22jloyzqanPlm7NyMlWY2p9WEl0aGnB4OhtAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACFSURBVHjafc9JDsIwDAVQZ24Z6oTMQ9v735KKpBIgxF948fRly7B8BX4Clk9o1xszhi6oB4BSYKjRRHXQnldCjcj3bTRSmrkQQgEMIHxKBLXf2HlluniPOMdYOgSSrZUyw95eQGu1jyNSAvaGZasLYY2Mjx0BmMNCdufOpZrSY7Q/z73nCUhGDfNYdoyfAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_int_2.png': ImageMeta(512, 512, Color(0xFF43B7AE), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWhpKLh2Nbkn2nnsZ6pcFb1yphvb6O14N0/KB5WOSx2TDlgTURhwLp2ycOBfqvFczz2kTn+/v3LuK3w287shjVIsqn2uJDw6efZ2dT60rKIZaM9sqlstqmIr52jWjrS5+U+Hof2AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB3SURBVHjajc/JDsMgDARQ20CS7o0NGMj2/39ZqYRKzSlzsp5GIxnGQ+AUAH/PlBrchgs7TevKO/DVgqgY00CtZdQtxtRGiUZUnJf7DtF7Iu7nJfQV3v7ls4EA0+PXEIohTGGrgADiHDy7rm5INoiScylFzv7ylw+tlRBGvibd0AAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_int_3.png': ImageMeta(512, 512, Color(0xFF46BE93), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXW2t1hvqRtyKuauqeg2M0zVlw8s41xQjpAX2R9v++LhXWzv8KE0LfTknrTsaf7xor8/P3o7O5FvJPX5u7X09Pp2NCKx7Svycv2uXM4j3dtPTOkbV2xmZWz5dj13b7x69/GtwO6AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABsSURBVHjajY9XCoBAEEPH3nXKFvve/5YKsjYQTP4eISSAL8FPAEAgN6CycV5ipN0HmMdGo6N+9UBPU9v16M4EmlKR0leiZl4w0lcH7wpDLDyIU+bAEIoHEjAbESvid0TDYB9LbZ5Ury+KPs9tv8MQZeDJ3mkAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_int_4.png': ImageMeta(512, 512, Color(0xFF57ACA7), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWyp6POsaLVlG7e4NSbqcK6wtXCf1bEusb+/f3MmI/KjoPc5exHWYpXqqbqybbq6Nzs6Oxztra4pbO2t8rN1c7X2+rwqoj95q83S4FbbZxGdYluY317d5J2k7JorbCbmKetIjObAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABkSURBVHjapc5HDoAwDERRh1DsOI3e4f63BBEiIZbwl08eyYCv4CMIi32PVRVB5Ilz0iklb0i6zjIjUbxoANAi0p4F8KUxJXOt9XjDZkTjC7EMug2TdaKrWXOANgV1RlD/eP3ZAfb9CWz3hx9TAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_int_5.png': ImageMeta(512, 512, Color(0xFFFEF5D6), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+4G767N3k1rT6+fj+8tDT2eLR69TVx6wWuqwgtaQ7wrNfPj5RWHBRdYR7WVNjZn1qboN0e5J5pox9vKFuz76Wmaqauaedz5uRwqDIh2/foYjFu6bd0LnV0Mfd4engwcp0e/0XAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABUSURBVHjaY2BGAwy4BFhYUAVYGBhYUAXYmaBqGKB8bj5UFTKSUvLIAoxswhJisggBRmkuTnERNhRrOYTYUN3By4PmMH4BVAFWUUE0AVZWOQKegwMAZPcEpOcpVh8AAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_phone_1.png': ImageMeta(512, 512, Color(0xFF49B37E), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v7v07ROsX66u8Tr59vKys7P0dc+TGNPSlpRVm52d4fGl4HDv8PIy7vpokv0uZvw6uJts5RwuaOjprGus4e3xIKp07/QppPSxZTF5djqvqHxzLr20pEAAAAAAAAAAAD7BuwKAAAAIHRSTlP//////////////////////////////////////wAAAHHg0nIAAABSSURBVHjajY+3EQAxCAQFQt6/d/3X+SlkIrudM4NSk1cBKnDwmXIRB6v3VkTS2YRBtfRQZxo2HDsvpQOX/vLIjVhEh3VOrugQtAQxSmByNrNv/kmeAj+BjgLiAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_phone_2.png': ImageMeta(512, 512, Color(0xFFE5F8F6), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWfppngl2DTqomqi3qz0Ljvw7N1rKFyxbi43NrzdV7C4N/9/f3uqpDW7OiQ1sfx2dJZSFSMx7alppKtsZjR3Nzqm3Hs5eVMiIR3h3qwrKrMmGvOqHTCuHXNxbja8e/3no35QjpiAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABwSURBVHjajc83FoQwEAPQsQ2bRs6BDPe/5Tb27oMKlf+pkIgvoVtgAS5T+gPsQc65tO8NjjcpqSZOFXpbHhHYtK6guSAg99ygs1tQgsKvIUHerMZ0ssIL8WlWT1FU+EB4s8xZzG2pzOM4DLTc/3LKF38MDDAQpdwCAAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_phone_3.png': ImageMeta(512, 512, Color(0xFFFCC78D), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXa2NKiuKWkvcf+/v7t6+vWxLXqupH1xYxtudDOuKZ8x82OlpDRon3IqZBZprCNqpOXuqmgl46xuJq61ODImoPZtYzR1tPV5eLqrIzpy6l/lZh7nrR4xK6Kx8O+o4WtqauPFc8EAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABxSURBVHjajc9HDoNQDARQJ39s/0bvkIT73xJRBElWePk0Go3J/B3dBgDfAJKmxQVkpJdxPgGJYelDwAVkpiJkj+6AlquqrnNvfbcBq3u+X9bbvOQNXJSYpbZsVIc94TjhIv2oynCUrvUuKuFnOuPmcwsBXgXvgVUqRwAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_phone_4.png': ImageMeta(512, 512, Color(0xFF37A5A2), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXuzKWxmo3gspTW3N2ocFeducKn0tP8/f3k5+nc5Ojn2Mwynp00oZ9XkJpRrayJxcWqsrfMl3vPu7DPx73Yy8ftq4k2oqBcsrF6RzZsipVrvLqCTjyMWkeRYVCcc2SRtK8qxnLrAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABiSURBVHjaY2BHAwzkCggLsXMxsXPABRglpOXYubgYGGACsiyCgkAKoUJGVFRIBNkMEUYmAXlkATYebj4eJAFOPm4xcSlOBrgABz+/MDNQHC7AzMrLKykAFYGo4+Dg4CTaLwBvBQhqJT9HCAAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_phone_5.png': ImageMeta(512, 512, Color(0xFFFCB98C), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEW0pJ/S09mnmGrGjGSercG40rLcsY/qw6f9/fzr6udytevqrIXvtpHopX7z2MlON0HNp5F1Y2t7mKiKs8q8mnq6ytnPkl7GlWzw5957qMmBWVOWbWCUh46UoV6QrWCYoKdrDfdrAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABlSURBVHjadc9HFoAgDEVRwAoJggWxu/9dqgMNePQN7yQ/rHzF/oDzGGpj6hAykcyGEchVaK0DKGEDnBaCClprW06AqbpyNwzoFPN+x4rOqq7PUceQABAMamwaWwRL5RktlU9f3x4AswmlGGG9mgAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_pres_1.png': ImageMeta(512, 512, Color(0xFFD2DCE6), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWWoq52mY2UcmOt0chwQChlYGJlfKGBSCm6kn3PgVfiu6zgxbrx2c3+/v7Q2uTK1NrY4+vLyczk6vCVpLC6xdM6WItUa42uusy52+pzoaKOiHvQuq/qs5k0ZW5DXoZVaHhkBK51AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB+SURBVHjadc/ZDsJACAVQ2rprLzBbV+3//6XoTJtolAcCh5AAtV9Bv0AA9GxJMrx74SIGgGHfSK4MGO1rqicGF6iPIzPP1w1259rWL7qBH4fJdVUMKzTVIOIfsVuB7ySgmAoIdE9ASAvlOxxusxocknf5dDepigRP7t9zH/EEgZUOQm0QXl8AAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pres_2.png': ImageMeta(512, 512, Color(0xFFE8F5F7), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWapJze6OXQpG7MsZyflXCrzK7ezq2iclN0cFtwq+Cr0NRhkTt2nHBlnKxYPTBhXj55fquHWT2QvOXTjzz6/P3U5+usx9Frnsez1+a319TQ2c9VpMusiHC4k2+lmYu9ubVCgdlQAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACJSURBVHjajc9HDgMxDANAWnLZmi7F9hb//5dbkUOQQ3gcQAKJ11fwFxh979ETjImPuq61kRNEZMPqUg5okqRIvrneYTJWcIBT723XZk1uOwkTsaqidRY7FCZev7CVEXmDYbgBzJM1NJkd+hnkPc3hSUePEMYuKuaqykdTGS00JvTy2VLWcsK/xy0AWxCHaCUr4gAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_pres_3.png': ImageMeta(512, 512, Color(0xFFF99101), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX21bKZaVOplqHo3M+VnWCextTUmHBncYVqn9GPo9j2mRv8wmB3ZVpreMNxyfKDaYzMuZXcs97+/v73kgmzhnHt6/RzrKmP2PPMqZLNprLNzMjL4vX5nTDtq4/9uIn5yonvDsDwAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABpSURBVHjapY5JDoAgFEM/oyKOHxBwvP8tNaImutQuunhp2gK+BN+AJQTRDTdgRAZEWsZVs5RY5t3Bsjh3CcCyW+A8o+4AYIyWQvTcNqkDimlq2dgTmeGVoCrPK+rrc3YtBhydEv7H9Yc23fgQrr69sF8AAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pres_4.png': ImageMeta(512, 512, Color(0xFFE4ECF3), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWlnZ3oyazl4NjKo6FydJyo19FWmZOck3ihmdSxza82eKMzi31NW2pvw72sZ1KUe+WKwmzLaVPzmUj8/f7X6e/m6++5xdSzu83K1NPGxMzN5dvorJCDlI+JqLS2prH0v48wnct5AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACQSURBVHjabc9HEoMwDAVQFYwhPZHkgin3vyU2OzL81dcbLSSQv8AVqOkJVEMMR+wAU60ls5C0BjKNqjqVoo7ITQ3ARZGUhChDqhAeHZvOvTMqL64wAxSRZREhZN82HPzQmAk/fhgqLM8REbdtQ+R3g9D385cA7AZdF9thGe+wxljHNRyHJfSrmlmOnOz6uVN2EwUQhtxOXbUAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pres_5.png': ImageMeta(512, 512, Color(0xFFEAFBF8), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXi3dXi0bVsrKKdnaDds5eo1tlsYVqnbE4om5ikfNCGnWa3ldCQx73ElX37/PzO5+nM1s+f0tekxsX3unKNeXFIe69ciqtOqaaOu7qkmJG5vM60wbu3y+C70tLGtZfUwZ5MNjOSAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB7SURBVHjajY/HDsMwDEPplaRLUm1nr///y9QZXUCB8qDDAymCoC/hP+Duq9wTcDoK/AFUkMy8QAiBehs3AGsyRYBMu+OWx1wxO30teiTQRTGWaPRNzaujKqvT5fFobOotMpSt7aBEvN5b0E7znIA/agetz8SC9y34OW4BQjUNzHq/UYEAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pub_1.png': ImageMeta(512, 512, Color(0xFFFDAA7B), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWjnXMvWF9VZWKUqKy34t/bpG/Zn4Ds0JDZ4+L9/f3o6+jKx7KwuLXPl3bq3MjQq5DMtZXQ1MbQ4ta2mHZudG21q48jT1hqtKmbtauinoGut5iux7a0xcPUzsPsqobz5dgOtz9tAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB7SURBVHjafc9XCsMwEARQOX2rmuVe7n/LGIFlY0Lm8zEsOwYuMb8hXOATEIA7LDC/Eeq6qXAHjhvIrZkOmEFei+EdkBd0ItW9AFjrxXI56hG8JtIVM4w0EXqKcaCQwaXWkyPTy9OtG2jXJhoH7Z21JjfCQzU/j3/GnfIF6vYLfzzCaUgAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pub_2.png': ImageMeta(512, 512, Color(0xFFFEEED4), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWxmHKSp5PitDzjsGTooony0qCgYkGsyr7j2db+/v3m6e3669XymUrZwrPqgzTTl3TP1tfyqGf/8dxxp6GGWjuTYVKQqKiybjvd4ulbnppuOSx/jZR4npR/q5ydfXSIlp1pGQLJAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABkSURBVHjabc9JDoAgDAXQIk5QBBRBnO9/SzUxUo1/+dIRxCfwD50QNQVE9NP2gsaAJ9BhbvISCVTjwnhWpKE2OAYEkLeGwUrWKqUHR+9ole7nL+wE5NUSEkjbnLExyqfizu+3B2VTCmY/VAN3AAAAAElFTkSuQmCC'),
+    'assets/images/scenarios/scenario_pub_3.png': ImageMeta(512, 512, Color(0xFFFDF6D8), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWon5vZ2daortjilWyZa2/XpJ5jiIiUeJBvVnFvdY2jyqT+wkLq0Ll8peDWssb9/f3u6/buy7Hw2s/m2uj159r2hlP7t4/Rp7Hb1PGulqfCh4vWzOzxfVH2nEr2ooDru6flMEo2AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACTSURBVHjabc9HEsMwCAVQQJbklqgX9/vf0o6kVcYsWLwZPgDqr+AVtFbm/PUGOucYwpWzrqCdc2fXMXBON2B+7pjAEyuocEQQAuMRWgab4gjCx4m1DGsMDoM11taRlXPj5YLmungBDrhtRLR901qApUVSSiRh7QsQ9XLZA/DnlgofYIf3MMK+F0BUs3+WobL25dsb33sOSQaKn+oAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_pub_4.png': ImageMeta(512, 512, Color(0xFFF75D57), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWinp3S1tehZ2HTr551dHx6fYS8inK+v8OrydPnm37+w6T+/v7sVlHlSETy6Oaxp6fqZWHwvLv01sv9upc7gptUWmVwho+JTVGUjpT5lpLuy8r+59tVS1BLUl5NhZZjSlJge+xjAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABoSURBVHjabc9ZDoAgDATQgrto2cHd+9/SxGgshvl8aTotiF8gC6sRgiUTFv0GFHpZFwUFBN7J1ZKl7RHAIgHmHDO0ttk9JnfIUCUtYppkSWBWJ49RzS/o4Yl+wKjxjjLfYYvWC+a/vQBCXQwhocP5iAAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_pub_5.png': ImageMeta(512, 512, Color(0xFFAD5C25), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXs396qi6KqpdfSm4W/dEG6iHzAdEHEv979/f3v6evTm3joyLatXCW4Zi+0xdXI1uX84td2l7imucv81sV4m8GbZm+cldGHp8rM0dNEeK1+pMqCW4Gbg6WKgM+Olq2Zs9DOC4zLAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB0SURBVHjafc9XCsNADATQtZ0yI3u7W6rvf8tsQGFNIJkPCR6MQAZfMb8h7YCxjEuq4CLnltxXzreGBk7BOVC6R5tGhehhmvtsWCs8TlPHZaxwsvYArAoBkGEQMCj0Ib8hh6dCXrxYK+t2/dzw6EvK+v+c5gUN8AnNdOziqwAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_soc_1.png': ImageMeta(512, 512, Color(0xFFF7E7DA), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXkrZOeqpvglG/dzalgYVxkmpOmz9GeZkrS0NBpgXuuyaY2UmliRTdCeYaFTjS9lnmnvsnObln+/v7t5Nfp1MmrdFe1ydPtmEfu1q7r7e6mhHSto42quq7FvazJ1M3Y6M0YpKdMAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACMSURBVHjafc9ZDoMwDARQLwkButtZCCRw/1u2CkWVqqr+fPJIMyBfB7+gl7wy8CbTGzpWnpheoA1GVcmas8ZIDTbvFz9p9DXiHgHATlRWHOcG3Ney3AIg8h7h+8mgczCfGRqgNaGg0/lqugbVGEMpAQRcG3hr7UIUgOAoZrGkRPCgY8vFyjD0n4//a59mCA8rTdek4wAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_soc_2.png': ImageMeta(512, 512, Color(0xFFFCF4DE), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXj3KVSbYne3c5lWGuIXVejlmGqlY3nombZs407OF45Y4FSOU1vpJqAdYGz0YOgysT+/v342qz358ryxJL88tz+yXrsuY04SXz4pHM6LUjslWg7TICmjYeyqKnTl3Dvx6XZVX3MAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACJSURBVHjadc9HDgIxDAVQp02luaROu/8tGSUgIQR/5+e/sOHxFfgNet2I5A2EYuzc4RmqgAiuFH0D1PcKQnCUJACkXw0K276RCEqDQGtUU4dybhocXVwmNRwppQoOhqhU3FPh1nC8LuoSOTBxhZ6vy5jNQIwN0PfjnG3vvcd2Ou7ZZNvmf8995AmOcBA5ech5rAAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_soc_3.png': ImageMeta(512, 512, Color(0xFF843B25), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWonZybZVDgkV2skmCXTzLps5RpaGJmg5xTMyrp1K/LxsVpQzhUfaCbhCePqcC9yJv0bjzGfmH+/v7u6ObUxLfu1sjRpHbOqI7Ut6vsu6SiezO2d1jKekrUnHLmy7j25dJZPJo2AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACKSURBVHjajc/HDgIxDARQO2VTlmqnbsv//yWbRUiAhISP7zAzBvo6+BuAP4BHa5kKhgM8lGDVCBTv2MFDroQomaIuHYIHjnKSWdPWOmzGXGA6T1LXENsOTZ5MXlNyVdeNe6gwImWRxLrqeLQ4OeC8LItS6llL12EAcZsVltcwt4OYMb5N5xD4x3MPrGAQFjt0jDcAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_soc_4.png': ImageMeta(512, 512, Color(0xFF9BD583), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWerJWmyZiqq2vRmmrftJXX1LHV3dtxo5FWZHV9mnfyhzk4SXN2pMqAeGyGwHH+/v727OaqqGry2s2mxbDZ58yGunm7i1ey26TKlmrTqI1udISdim+QnHiMlIOLpHe1gW7wZd2jAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAAB4SURBVHjanc9HDsMwDARAqttOEUV11///MoGExIBPQXicw+4S7OXgT0DQ1uq7/gIcx1sr2dBAkayKCAsxaMCVN4AoJ+E7sCpnj6gmCaZDWm6PUvi8CNYgpH0YneNmTT0UhRtWx922iU9t3uMzxtGfS3VmLIcff3kBq9EOkJ9GVh8AAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_soc_5.png': ImageMeta(512, 512, Color(0xFF78ACDD), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXQr6Te39zlrW5rk6eqp57bxZ4xcLFmoW9jlci0k3mjybC7z+Ooa1idt9f6yF38/f2oyunk6u3E2OyIpshGV3GtuLTt3NRblM1miK59lraDl6aVvuWexOepn5C1rKSnu9HmH7GPAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACGSURBVHjaXY+HDsMwCESJY2e2JeCRnf7/X9auR9SehNA9JOAA/wS+eEriCHbKU9oD4CpZ34k9mBBHa7wDh958AV7CITzgBtQPCKIfKAPbtp0Uqo6AbCWvU6uXWF0ErJtm3uS56bzjXc/amKXjApYVxvrJVK6En1R4OAA87mRHDDcVpbQ/+gDcaw7yBGGwPAAAAABJRU5ErkJggg=='),
+    'assets/images/scenarios/scenario_story_1.png': ImageMeta(512, 512, Color(0xFF566785), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXLrJTfy6Hd4NtvZ2yjnpBhcIo8fWF0RTanoXydyK253fD+/v4zilNUZYPM6fbL0dFIWHaVu5jd8fptOip9iJ2NeHatlIqvu5OpwY2ky7K01La208LkrY36t5rm4+U2dV45tBV2AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABvSURBVHjahc/JDoAgDATQsrkWEHfA5f//Uo0a0MQ4t77DTArlK/AJtVKqjqFQWh9yAlDHe07G8QLWpHSYCAF9wtJMUHpDBnN3wDw/V2xmHkAR0cWQI/aMLQEsJlJWbQC/7resaChthdBdx3+eu7MBWYYL/rJfY+IAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_story_2.png': ImageMeta(512, 512, Color(0xFFADC8DC), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEX+/v2tyNv+9dfY5e+Yts+FnqOaqsOWsHyjvtS1zuC50OLXq4/N3u790mX97sLi7PK0i3vFnYzB387B4M0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAW2/DAAAAIHRSTlP//////////////////////////wAAAAAAAAAAAAAAALESzYUAAABLSURBVHjajY9JDsAgDANDCPva8v+/0p6Qc8K3GdmKQnQbZsWtgWHqnbDzTJysUl40IagrzinhPbKt1QInk9M4PMyXKKeTfyES777cqh0BUNTY3fcAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_story_3.png': ImageMeta(512, 512, Color(0xFF254B89), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEVeYW1lZJKbXzegj2fnlC6vc1fNjW0gPGU4aY9nXTunts3ZqpwzWXtRLS9EOlODa8iNiJjueinceUHq17j+/v4tN1MnTIiVaFAsQWp2S0YvVI5aUlp3Vj54Vk+HWFCNdW6XA3U7AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABvSURBVHjajc83AgIxDAXRL8n2JjI4p/vfkkYNVDvl6wafv3AK9hKAEKjsCumWgBIoJIWrtSslv3ivEA+Hx3RVmoIX2S791d1UWEUWz09Ld4UaBcyoRArMrRkTM7GC4RyNsZibwhs5jzF6PE6//PQFRBoRd6lUchwAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_story_4.png': ImageMeta(512, 512, Color(0xFFCDEDF8), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEXg4qrU3Ndtl2VIZ2WKk3KNpI6kyHFqlY6w15G209zno3/ft4V8RDWFTTv8/f3X6cdlanCSxW5ydnfQ7fLY8fjDxMdJl6V9km+YppOPuXGoyY+72bldZW9rqmd2tIyIpWzy48C7AAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAACTSURBVHjadc+JCsMgDAbgqNVeW0209ezx/m9ZawdjYwsEwscfSGD6KvgHAB9gLYC10/xO2L63c6kbysieD2bn14rc9syGgbEp5Qs0RaJuHLtExHUB2Dai3bldhqCgJo7GtM61MqZ0JbQx6JUQKkjTVGgQVyNE9J7fQAcWWpEfpCpwHr1BLJsY6h05g2bLspT+9e0Js2EOzBoRt1MAAAAASUVORK5CYII='),
+    'assets/images/scenarios/scenario_story_5.png': ImageMeta(512, 512, Color(0xFFD7F2FA), 'iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAMAAAAoLQ9TAAAAYFBMVEWks7JtoaqEk2afscLTnHRwdX54fo1on3S/zb650N739/fR5+zL2+PJ1dnb8vnFysx7ipeMpbOzpZSxx9Ho7O9Wi7VMnIKSmJaXnKSYt80/mo04oJdbfYRuT0N7ZFtqb3WSt9esAAAAIHRSTlP//////////////////////////////////////////3Fe9GAAAABqSURBVHjalc/JDoMwDARQk1AKGTsre1v4/7/klBRxgjk+yaMxmUvoJsDCGghnAGP70eT1H0xdx/1FGaxtVYRzfQGocaVJcimSvMdPBWToBTF8Ofly0g1VaHjxZUcYlnnm07Ck2Tl59sspB/djC1IsNv1lAAAAAElFTkSuQmCC'),
+  };
+}
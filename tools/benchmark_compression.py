@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark the image compression path of generate_images.py.
+
+Runs the same decode -> resize -> quantize -> encode stages as
+compress_image over a fixed corpus and writes machine-readable JSON so
+runs can be compared when tuning MAX_SIZE / TARGET_QUALITY.
+
+Usage:
+  python tools/benchmark_compression.py
+  python tools/benchmark_compression.py --synthetic 40 --size 1024
+  python tools/benchmark_compression.py --jobs 4 --output bench.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import generate_images as gi
+
+STAGES = ("decode", "resize", "quantize", "encode")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+def committed_corpus(root: Path) -> list[tuple[str, bytes]]:
+    """(name, PNG bytes) for every committed asset, in sorted order."""
+    return [(str(p.relative_to(root)), p.read_bytes()) for p in gi.source_pngs(root)]
+
+
+def synthetic_corpus(count: int, size: int, seed: int = 0) -> list[tuple[str, bytes]]:
+    """Deterministic flat vector-style images, as rendered by the stub backend."""
+    return [(f"synthetic_{i:03d}.png", gi.render_synthetic(f"{seed}:{i}", size)) for i in range(count)]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+def bench_stages(corpus: list[tuple[str, bytes]]) -> list[dict]:
+    """Time each compression stage per image, in-process."""
+    from PIL import Image
+
+    rows = []
+    for name, raw in corpus:
+        t0 = time.perf_counter()
+        img = Image.open(io.BytesIO(raw))
+        if not gi._LOW_MEMORY:
+            # In low-memory mode decoding is deferred into the resize stage
+            img.load()
+        t1 = time.perf_counter()
+        resized = gi._resize(img)
+        t2 = time.perf_counter()
+        out = gi._quantize(resized)
+        t3 = time.perf_counter()
+        if out.mode != "P":
+            # A stage that silently does nothing would make every number below meaningless
+            sys.exit(f"Error: quantize left {name} in {out.mode} mode")
+        buf = io.BytesIO()
+        gi._save_png(out, buf)
+        t4 = time.perf_counter()
+        rows.append({
+            "name": name,
+            "input_bytes": len(raw),
+            "output_bytes": buf.tell(),
+            "output_mode": out.mode,
+            "width": img.width,
+            "height": img.height,
+            "seconds": dict(zip(STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3))),
+        })
+    return rows
+
+
+def bench_compress_all(
+    corpus: list[tuple[str, bytes]], jobs: int, low_memory: bool = False, max_decodes: int | None = None
+) -> float:
+    """Wall time of compress_all over a scratch copy of the corpus."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_root = Path(tmp)
+        for name, raw in corpus:
+            dest = tmp_root / "images" / name
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_bytes(raw)
+        start = time.perf_counter()
+        gi.compress_all(
+            tmp_root / "images", jobs=jobs, force=True, cache_path=tmp_root / "cache.json",
+            low_memory=low_memory, max_decodes=max_decodes,
+        )
+        return time.perf_counter() - start
+
+
+def summarize(rows: list[dict], wall: float | None, jobs: int) -> dict:
+    stage_totals = {s: sum(r["seconds"][s] for r in rows) for s in STAGES}
+    busy = sum(stage_totals.values())
+    summary = {
+        "images": len(rows),
+        "input_bytes": sum(r["input_bytes"] for r in rows),
+        "output_bytes": sum(r["output_bytes"] for r in rows),
+        "stage_seconds": stage_totals,
+        "images_per_second": len(rows) / busy if busy else 0.0,
+        "peak_rss_kb": gi.peak_rss_kb(),
+    }
+    if wall is not None:
+        summary["compress_all"] = {
+            "jobs": jobs,
+            "seconds": wall,
+            "images_per_second": len(rows) / wall if wall else 0.0,
+        }
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark generate_images.py compression")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="Use N synthetic images instead of assets/images")
+    parser.add_argument("--size", type=int, default=1024, help="Side length of synthetic images (default: 1024)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the compress_all run (default: 1)")
+    parser.add_argument("--low-memory", action="store_true", help="Benchmark the --low-memory compression path")
+    parser.add_argument("--max-decodes", type=int, help="Cap concurrent full-resolution decodes in compress_all")
+    parser.add_argument("--skip-compress-all", action="store_true", help="Only run the per-stage benchmark")
+    parser.add_argument("--output", type=Path, help="Write JSON results here (default: stdout)")
+    args = parser.parse_args()
+
+    root = Path(__file__).resolve().parent.parent
+    if args.synthetic:
+        corpus = synthetic_corpus(args.synthetic, args.size)
+    else:
+        corpus = committed_corpus(root / "assets" / "images")
+    if not corpus:
+        print("Error: empty corpus", file=sys.stderr)
+        sys.exit(1)
+
+    gi._init_compress_worker(args.low_memory)
+    rows = bench_stages(corpus)
+    wall = None
+    if not args.skip_compress_all:
+        # compress_all prints per-file progress; keep stdout clean for the JSON
+        stdout, sys.stdout = sys.stdout, sys.stderr
+        try:
+            wall = bench_compress_all(corpus, args.jobs, args.low_memory, args.max_decodes)
+        finally:
+            sys.stdout = stdout
+
+    result = {
+        "settings": {
+            "max_size": gi.MAX_SIZE,
+            "target_quality": gi.TARGET_QUALITY,
+            "palette_colors": gi.PALETTE_COLORS,
+            "low_memory": args.low_memory,
+            "max_decodes": args.max_decodes,
+        },
+        "corpus": f"synthetic:{args.synthetic}x{args.size}" if args.synthetic else "assets/images",
+        "platform": {"python": platform.python_version(), "machine": platform.machine()},
+        "summary": summarize(rows, wall, args.jobs),
+        "images": rows,
+    }
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,37 @@ Usage:
   python tools/generate_images.py --api-key <KEY> --only categories
   python tools/generate_images.py --api-key <KEY> --only characters
   python tools/generate_images.py --api-key <KEY> --only mascots
+  python tools/generate_images.py --dry-run
+  python tools/generate_images.py --verify [--max-file-kb 200 --max-total-kb 10240]
+  python tools/generate_images.py --compress-only --dedup [--regenerate-duplicates]
+  python tools/generate_images.py --api-key <KEY> --resume
+  python tools/generate_images.py --backend stub --stub-latency 2 --stub-failure-rate 0.1 --concurrency 8
   python tools/generate_images.py --compress-only
+  python tools/generate_images.py --compress-only --jobs 8
+  python tools/generate_images.py --compress-only --jobs 8 --low-memory --max-decodes 2
+  python tools/generate_images.py --compress-only --variants [--webp]
+  python tools/generate_images.py --compress-only --optimize [--max-error 0.02]
+  python tools/generate_images.py --compress-only --trim
+  python tools/generate_images.py --compress-only --atlas characters scenarios
+
+Peak RSS (main process and largest worker) is printed after --compress-only
+and recorded in every run report, except on Windows. To compare modes on large sources:
+  python tools/benchmark_compression.py --synthetic 6 --size 3072 --jobs 2 [--low-memory]
 """
 
 import argparse
+import datetime
+import hashlib
 import io
+import json
 import os
 import sys
+import threading
 import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable
 
 # ---------------------------------------------------------------------------
 # Style prefix shared by every prompt
@@ -320,194 +342,2562 @@ SCENARIOS = [
 # ---------------------------------------------------------------------------
 MAX_SIZE = 512  # px — longest side after resize
 TARGET_QUALITY = 6  # PNG compress_level (0-9, higher = smaller)
+PALETTE_COLORS = 256  # quantized palette size
+MODEL = "gemini-3.1-flash-image-preview"
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_DELAY = 5  # seconds — base of the exponential back-off
+RETRY_MAX_DELAY = 60  # seconds — back-off cap (server retry-after hints may exceed it)
+# The circuit breaker pauses every worker for BREAKER_COOLDOWN seconds once
+# BREAKER_THRESHOLD of the last BREAKER_WINDOW API calls have failed.
+BREAKER_WINDOW = 20
+BREAKER_THRESHOLD = 0.5
+BREAKER_COOLDOWN = 30  # seconds
+REQUESTS_PER_SECOND = 0.5  # API rate limit shared by all generation workers
+COMPRESS_CACHE = Path(__file__).resolve().parent / ".compress_cache.json"
+# Flutter resolution-aware variants. The largest density is rendered at
+# MAX_SIZE; the 1.0x image replaces the base file that AppImages points at.
+DENSITIES = (1.0, 2.0, 3.0)
+REPORTS_DIR = Path(__file__).resolve().parent / "reports"
+# Lockfile of generation inputs per asset; committed so stale images show up in review
+MANIFEST = Path(__file__).resolve().parent / "images.lock.json"
+# Assets deduplicated into another one's file: {duplicate path: shared path}
+ALIASES = Path(__file__).resolve().parent / "images.aliases.json"
+ATLAS_MAX_SIZE = 2048  # px — atlas side limit (safe GPU texture size on old devices)
+ATLAS_PADDING = 2  # px between sprites, avoids bleeding when sampled with filtering
+ATLAS_DIR = "assets/atlases"
+ATLAS_DART = "lib/app/theme/app_atlases.dart"
+PLACEHOLDER_SIZE = 16  # px — longest side of the inline LQIP thumbnail
+IMAGE_META_DART = "lib/app/theme/app_image_meta.dart"
+APP_IMAGES_DART = "lib/app/theme/app_images.dart"
+# --verify budgets; bases and density variants all count toward the total
+MAX_FILE_BYTES = 200 * 1024
+MAX_TOTAL_BYTES = 10 * 1024 * 1024
+# Two images are near duplicates when both their 64-bit aHash and pHash
+# differ in at most this many bits. At 6 the committed character busts
+# (same pose and framing by design) already start to match.
+DEDUP_MAX_DISTANCE = 4
+JOURNAL = Path(__file__).resolve().parent / ".generate_journal.jsonl"
+RESPONSE_CACHE_DIR = Path(__file__).resolve().parent / ".response_cache"
+RESPONSE_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # LRU-evicted beyond 1 GB
+# --optimize searches these palette sizes and keeps the smallest encoding
+# whose perceptual error (1 - SSIM) against the unquantized image stays
+# under MAX_PERCEPTUAL_ERROR.
+OPTIMIZE_COLORS = (32, 64, 128, 256)
+MAX_PERCEPTUAL_ERROR = 0.02
+# --trim keys the white background to transparent: pixels connected to the
+# border whose darkest channel is >= BACKGROUND_THRESHOLD become fully
+# transparent, fading back to opaque over BACKGROUND_FEATHER levels below it.
+BACKGROUND_THRESHOLD = 245
+BACKGROUND_FEATHER = 24
+TRIM_PADDING = 8  # px of transparent margin kept around the content
+TRIM_BATCH = 8  # images per compression worker batch, stacked for NumPy by size
 
 
 # ---------------------------------------------------------------------------
 # Compression
 # ---------------------------------------------------------------------------
-def compress_image(path: Path) -> None:
-    """Resize to 512x512 max, RGBA, optimized PNG."""
+# Set per process by _init_compress_worker (the parent counts as a worker when jobs == 1)
+_LOW_MEMORY = False
+_DECODE_SLOTS = None
+
+
+def _init_compress_worker(low_memory: bool, decode_slots=None) -> None:
+    global _LOW_MEMORY, _DECODE_SLOTS
+    _LOW_MEMORY = low_memory
+    _DECODE_SLOTS = decode_slots
+
+
+@contextmanager
+def _decode_slot():
+    """Hold one of the shared full-resolution decode slots, if a cap is set."""
+    if _DECODE_SLOTS is None:
+        yield
+        return
+    with _DECODE_SLOTS:
+        yield
+
+
+def _compress_pool(jobs: int, low_memory: bool = False, max_decodes: int | None = None):
+    """Process pool whose workers share the low-memory setting and decode cap."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    slots = multiprocessing.BoundedSemaphore(max_decodes) if max_decodes else None
+    return ProcessPoolExecutor(
+        max_workers=max(1, jobs), initializer=_init_compress_worker, initargs=(low_memory, slots)
+    )
+
+
+def _resize(img, max_size: int = MAX_SIZE):
+    """Convert to RGBA and shrink so the longest side is at most max_size."""
+    from PIL import Image
+
+    if _LOW_MEMORY and img.mode in ("RGB", "RGBA", "L", "LA"):
+        # Shrink the lazily opened image before converting: JPEG sources decode
+        # at reduced scale via draft(), and no full-resolution RGBA copy is made.
+        with _decode_slot():
+            if img.width > max_size or img.height > max_size:
+                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            img.load()
+        return img.convert("RGBA")
+
+    # The full-resolution RGBA copy lives until thumbnail() replaces it, so
+    # the slot covers both
+    with _decode_slot():
+        img = img.convert("RGBA")
+        # Resize preserving aspect ratio
+        if img.width > max_size or img.height > max_size:
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    return img
+
+
+def _quantize(img):
+    """Reduce to a PALETTE_COLORS palette ("P" image; alpha is kept in the palette).
+
+    MEDIANCUT only accepts RGB, so it is used when the alpha channel is
+    unused; translucent images go through libimagequant when Pillow has it,
+    FASTOCTREE otherwise.
+    """
+    from PIL import Image, features
+
+    if img.mode != "RGBA" or img.getextrema()[3][0] == 255:
+        return img.convert("RGB").quantize(
+            colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.FLOYDSTEINBERG
+        )
+    method = Image.Quantize.LIBIMAGEQUANT if features.check("libimagequant") else Image.Quantize.FASTOCTREE
+    return img.quantize(colors=PALETTE_COLORS, method=method, dither=Image.Dither.FLOYDSTEINBERG)
+
+
+def _save_png(img, dest) -> None:
+    """Encode with the shared compression settings (dest may be a path or file object)."""
+    img.save(dest, "PNG", optimize=True, compress_level=TARGET_QUALITY)
+
+
+def _quantize_within(img, max_error: float | None = None):
+    """_quantize, or with a max_error the optimize_palette search. Returns (image, description)."""
+    if max_error is None:
+        return _quantize(img), ""
+    return optimize_palette(img, max_error)
+
+
+def _compress_pil(img, max_size: int = MAX_SIZE, max_error: float | None = None):
+    """Resize to max_size (default 512) and quantize in memory. Returns the image to save."""
+    return _quantize_within(_resize(img, max_size), max_error)[0]
+
+
+def _compress_pil_batch(
+    images: list, trim: bool = False, max_error: float | None = None
+) -> list[tuple[object, int, str]]:
+    """Resize and quantize a batch in memory. Returns (image to save, pixels
+    cropped, palette description) per image.
+
+    With trim, the white background of the resized RGBA images is keyed out
+    and cropped (as one NumPy batch per size) before quantization, so the
+    palette is only built once, from the full-colour pixels. With max_error
+    the palette search runs on those same pixels.
+    """
+    resized = [_resize(img) for img in images]
+    trimmed = trim_images(resized) if trim else resized
+    results = []
+    for img, out in zip(resized, trimmed):
+        quantized, palette = _quantize_within(out, max_error)
+        results.append((quantized, img.width * img.height - out.width * out.height, palette))
+    return results
+
+
+def compress_image(path: Path, trim: bool = False, max_error: float | None = None) -> int:
+    """Resize to 512x512 max, optionally trim, quantize, optimized PNG. Returns the new size in bytes."""
+    from PIL import Image
+
+    with Image.open(path) as src:
+        [(out, _, _)] = _compress_pil_batch([src], trim, max_error)
+    _save_png(out, path)
+    remove_variants(path)
+    return path.stat().st_size
+
+
+def compress_bytes(
+    raw: bytes, out_path: Path, trim: bool = False, max_error: float | None = None
+) -> tuple[int, int, str]:
+    """Decode raw API bytes once, resize, optionally trim and quantize in memory,
+    and write only the final palette PNG. Returns (bytes, pixels cropped,
+    palette description)."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(raw)) as src:
+        [(out, cropped, palette)] = _compress_pil_batch([src], trim, max_error)
+    buf = io.BytesIO()
+    _save_png(out, buf)
+    # Written in one go, so an interrupted run never leaves a truncated asset
+    tmp = out_path.with_suffix(".tmp")
+    tmp.write_bytes(buf.getvalue())
+    tmp.replace(out_path)
+    remove_variants(out_path)
+    return buf.tell(), cropped, palette
+
+
+def _density_dir(density: float) -> str:
+    return f"{density}x"
+
+
+def variant_paths(path: Path) -> list[Path]:
+    """Every density variant (and WebP) file that may exist for a base asset, base excluded."""
+    variants = [path.parent / _density_dir(d) / path.name for d in DENSITIES if d != 1.0]
+    return variants + [v.with_suffix(".webp") for v in variants] + [path.with_suffix(".webp")]
+
+
+def remove_variants(path: Path) -> None:
+    """Delete a base's density variants; called whenever the base is rewritten,
+    since Flutter would otherwise keep showing the old art on high-DPI screens."""
+    for variant in variant_paths(path):
+        variant.unlink(missing_ok=True)
+
+
+def source_pngs(root: Path) -> list[Path]:
+    """Every PNG under root except generated density variants (2.0x/, 3.0x/ ...)."""
+    variant_dirs = {_density_dir(d) for d in DENSITIES}
+    return sorted(p for p in root.rglob("*.png") if p.parent.name not in variant_dirs)
+
+
+def write_variants(path: Path, webp: bool = False, max_error: float | None = None) -> list[tuple[Path, int]]:
+    """Write Flutter density variants for one asset. Returns [(path, bytes)].
+
+    The highest-density copy doubles as the source for later runs, so the
+    base file can be overwritten with the 1.0x rendition without losing
+    resolution.
+    """
+    from PIL import Image
+
+    top = max(DENSITIES)
+    top_path = path.parent / _density_dir(top) / path.name
+    source_path = path
+    with Image.open(path) as base:
+        # Compression deletes the variants of every base it rewrites, so a top
+        # variant next to a base no larger than the 1.0x rendition means an
+        # earlier run wrote the base, and the top variant is the source.
+        if max(base.size) <= round(MAX_SIZE / top) and top_path.exists():
+            source_path = top_path
+    source = Image.open(source_path)
+    source.load()
+
+    written = []
+    # Largest first, so the top-density source exists before the base is replaced
+    for density in sorted(DENSITIES, reverse=True):
+        target = path if density == 1.0 else path.parent / _density_dir(density) / path.name
+        target.parent.mkdir(exist_ok=True)
+        # Trimmed sources are smaller than MAX_SIZE; keep the density ratios exact
+        size = round(min(max(source.size), MAX_SIZE) * density / top)
+        if size == max(source.size) and source.mode == "P":
+            # Already a final palette image; re-quantizing it would only lose quality
+            out = source
+            if target != source_path:
+                target.write_bytes(source_path.read_bytes())
+        else:
+            out = _compress_pil(source, size, max_error)
+            _save_png(out, target)
+        written.append((target, target.stat().st_size))
+        if webp:
+            webp_path = target.with_suffix(".webp")
+            out.save(webp_path, "WEBP", lossless=True, quality=80, method=4)
+            written.append((webp_path, webp_path.stat().st_size))
+    return written
+
+
+def _variants_one(
+    path: Path, webp: bool = False, final_hashes: frozenset[str] = frozenset(), max_error: float | None = None
+) -> tuple[Path, list[tuple[Path, int]], str, str, str | None]:
+    """Worker entry point: (path, [(written path, bytes)], source hash, base output hash, error).
+
+    A base whose hash is a known variants output, with all its variant files
+    present, is left alone and reported with its current sizes.
+    """
+    try:
+        src_hash = _file_digest(path)
+        targets = [path] + [path.parent / _density_dir(d) / path.name for d in DENSITIES if d != 1.0]
+        if webp:
+            targets += [t.with_suffix(".webp") for t in targets]
+        if src_hash in final_hashes and all(t.exists() for t in targets):
+            return path, [(t, t.stat().st_size) for t in targets], src_hash, src_hash, None
+        written = write_variants(path, webp, max_error)
+        return path, written, src_hash, _file_digest(path), None
+    except Exception as e:
+        return path, [], "", "", f"{type(e).__name__}: {e}"
+
+
+def _variants_settings_key(webp: bool = False, trim: bool = False, max_error: float | None = None) -> str:
+    densities = "-".join(str(d) for d in DENSITIES)
+    return f"variants-{_compress_settings_key(trim, max_error)}-d{densities}{'-webp' if webp else ''}"
+
+
+def build_variants(
+    root: Path,
+    jobs: int = 1,
+    webp: bool = False,
+    force: bool = False,
+    cache_path: Path = COMPRESS_CACHE,
+    trim: bool = False,
+    max_error: float | None = None,
+) -> None:
+    """Emit 1.0x/2.0x/3.0x variants (and optional WebP) for every asset under root.
+
+    Downscaled variants get the same palette treatment as compression (the
+    max_error search, if given). The rewritten 1.0x base is recorded as
+    final in the compression cache for the given settings, so later runs
+    don't recompress it, and rebuild variants only for bases that changed.
+    """
+    pngs = source_pngs(root)
+    if not pngs:
+        print("No PNGs found for variants.")
+        return
+    print(f"\nBuilding {len(DENSITIES)} density variants for {len(pngs)} images...")
+
+    cache = load_compress_cache(cache_path)
+    entries = cache.setdefault(_variants_settings_key(webp, trim, max_error), {})
+    final_hashes = frozenset() if force else frozenset(entries.values())
+
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            worker = partial(_variants_one, webp=webp, final_hashes=final_hashes, max_error=max_error)
+            results = list(pool.map(worker, pngs))
+    else:
+        results = [_variants_one(p, webp, final_hashes, max_error) for p in pngs]
+
+    totals: dict[str, int] = {}
+    failed = skipped = 0
+    for path, written, src_hash, out_hash, error in results:
+        if error is not None:
+            failed += 1
+            print(f"  FAILED {path.name}: {error}")
+            continue
+        sizes = []
+        for target, size in written:
+            label = target.parent.name if target.parent != path.parent else "1.0x"
+            key = f"{label} {target.suffix[1:]}"
+            totals[key] = totals.get(key, 0) + size
+            sizes.append(f"{key} {size / 1024:.1f} KB")
+        if src_hash in final_hashes:
+            skipped += 1
+            print(f"  Cached {path.name}: {', '.join(sizes)}")
+            continue
+        entries[src_hash] = out_hash
+        _mark_final(cache, out_hash, _compress_settings_key(trim, max_error))
+        print(f"  {path.name}: {', '.join(sizes)}")
+    save_compress_cache(cache, cache_path)
+
+    print()
+    for key in sorted(totals):
+        print(f"Total {key}: {totals[key] / 1024:.1f} KB")
+    if skipped:
+        print(f"{skipped} image(s) already had up-to-date variants (use --force to redo)")
+    if failed:
+        print(f"{failed} file(s) failed")
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _compress_settings_key(trim: bool = False, max_error: float | None = None) -> str:
+    """Cache namespace — changing any compression setting invalidates old entries."""
+    # "-palette": earlier outputs were saved as RGBA and must be redone
+    key = f"max{MAX_SIZE}-level{TARGET_QUALITY}-colors{PALETTE_COLORS}-palette"
+    if trim:
+        key += f"-trim-t{BACKGROUND_THRESHOLD}-f{BACKGROUND_FEATHER}-p{TRIM_PADDING}"
+    if max_error is not None:
+        key += f"-optimize{'-'.join(map(str, OPTIMIZE_COLORS))}-err{max_error}"
+    return key
+
+
+def load_compress_cache(cache_path: Path = COMPRESS_CACHE) -> dict[str, dict[str, str]]:
+    """Load {settings_key: {source_hash: output_hash}}; a missing or corrupt file is an empty cache."""
+    try:
+        return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _mark_final(cache: dict[str, dict[str, str]], out_hash: str, *keys: str) -> None:
+    """Record out_hash as an already-final output in each cache namespace, so
+    the passes using those namespaces skip a file a later pass rewrote."""
+    for key in keys:
+        cache.setdefault(key, {})[out_hash] = out_hash
+
+
+def save_compress_cache(cache: dict[str, dict[str, str]], cache_path: Path = COMPRESS_CACHE) -> None:
+    tmp = cache_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, indent=1, sort_keys=True))
+    tmp.replace(cache_path)
+
+
+CompressResult = tuple[Path, int, str, str, str | None, float, int, str]
+
+
+def _compress_batch(
+    paths: list[Path],
+    final_hashes: frozenset[str] = frozenset(),
+    trim: bool = False,
+    max_error: float | None = None,
+) -> list[CompressResult]:
+    """Worker entry point: never raises, so one bad file can't take down the pool.
+
+    Returns (path, size, source_hash, output_hash, error, seconds, pixels
+    cropped, palette description) per file, in order. Files whose hash is already a known
+    compressed output are left untouched; the rest are compressed together
+    by _compress_pil_batch, and each is charged an equal share of the time.
+    """
     from PIL import Image
 
-    img = Image.open(path)
-    img = img.convert("RGBA")
+    start = time.perf_counter()
+    done: dict[Path, tuple[int, str, str, str | None, int, str]] = {}
+    todo: list[tuple[Path, str]] = []
+    images = []
+    for path in paths:
+        try:
+            src_hash = _file_digest(path)
+            if src_hash in final_hashes:
+                done[path] = (path.stat().st_size, src_hash, src_hash, None, 0, "")
+                continue
+            images.append(Image.open(path))
+            todo.append((path, src_hash))
+        except Exception as e:
+            done[path] = (0, "", "", f"{type(e).__name__}: {e}", 0, "")
+    try:
+        outputs = _compress_pil_batch(images, trim, max_error)
+    except Exception as e:
+        # Without per-image results, the whole batch failed
+        outputs = []
+        done.update((path, (0, "", "", f"{type(e).__name__}: {e}", 0, "")) for path, _ in todo)
+    finally:
+        for img in images:
+            img.close()
+    for (path, src_hash), (out, cropped, palette) in zip(todo, outputs):
+        try:
+            _save_png(out, path)
+            remove_variants(path)
+            done[path] = (path.stat().st_size, src_hash, _file_digest(path), None, cropped, palette)
+        except Exception as e:
+            done[path] = (0, "", "", f"{type(e).__name__}: {e}", 0, "")
+    seconds = (time.perf_counter() - start) / max(1, len(paths))
+    results = []
+    for path in paths:
+        size, src_hash, out_hash, error, cropped, palette = done[path]
+        results.append((path, size, src_hash, out_hash, error, seconds, cropped, palette))
+    return results
+
+
+def _compress_one(
+    path: Path, final_hashes: frozenset[str] = frozenset(), trim: bool = False, max_error: float | None = None
+) -> CompressResult:
+    """Worker entry point for a single file; see _compress_batch."""
+    return _compress_batch([path], final_hashes, trim, max_error)[0]
 
-    # Resize preserving aspect ratio
-    if img.width > MAX_SIZE or img.height > MAX_SIZE:
-        img.thumbnail((MAX_SIZE, MAX_SIZE), Image.Resampling.LANCZOS)
 
-    # Quantize to reduce palette (keeps transparency)
+def _compress_bytes_one(
+    raw: bytes, out_path: Path, trim: bool = False, max_error: float | None = None
+) -> CompressResult:
+    """Worker entry point for in-memory compression; same result shape as _compress_one.
+
+    If compression fails the raw bytes are written as-is so the API result
+    is never lost.
+    """
+    start = time.perf_counter()
+    src_hash = hashlib.sha256(raw).hexdigest()
     try:
-        quantized = img.quantize(colors=256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.FLOYDSTEINBERG)
-        quantized = quantized.convert("RGBA")
-        out = quantized
-    except Exception:
-        out = img
+        size, cropped, palette = compress_bytes(raw, out_path, trim, max_error)
+        seconds = time.perf_counter() - start
+        return out_path, size, src_hash, _file_digest(out_path), None, seconds, cropped, palette
+    except Exception as e:
+        out_path.write_bytes(raw)
+        remove_variants(out_path)
+        error = f"{type(e).__name__}: {e} (saved uncompressed)"
+        return out_path, len(raw), src_hash, "", error, time.perf_counter() - start, 0, ""
 
-    out.save(path, "PNG", optimize=True, compress_level=TARGET_QUALITY)
-    size_kb = path.stat().st_size / 1024
-    print(f"  Compressed {path.name}: {size_kb:.1f} KB")
 
+def compress_all(
+    root: Path,
+    jobs: int = 1,
+    force: bool = False,
+    cache_path: Path = COMPRESS_CACHE,
+    stats: "RunStats | None" = None,
+    low_memory: bool = False,
+    max_decodes: int | None = None,
+    trim: bool = False,
+    max_error: float | None = None,
+) -> None:
+    """Compress every PNG under root, optionally across a process pool.
 
-def compress_all(root: Path) -> None:
-    """Compress every PNG under root."""
-    pngs = sorted(root.rglob("*.png"))
+    Images already in their compressed state (per the content-hash cache)
+    are skipped unless force is set. low_memory shrinks before converting,
+    and max_decodes caps full-resolution decodes in flight across workers.
+    With trim, each worker keys and crops TRIM_BATCH images at a time
+    between resizing and quantizing; with max_error, the palette search
+    replaces the default quantization.
+    """
+    pngs = source_pngs(root)
     if not pngs:
         print("No PNGs found to compress.")
         return
-    print(f"\nCompressing {len(pngs)} images...")
-    for p in pngs:
-        compress_image(p)
-    total = sum(p.stat().st_size for p in pngs) / 1024
+    print(f"\nCompressing {len(pngs)} images ({jobs} job{'s' if jobs != 1 else ''})...")
+
+    cache = load_compress_cache(cache_path)
+    entries = cache.setdefault(_compress_settings_key(trim, max_error), {})
+    final_hashes = frozenset() if force else frozenset(entries.values())
+
+    size = TRIM_BATCH if trim else 1
+    batches = [pngs[i:i + size] for i in range(0, len(pngs), size)]
+    if jobs > 1:
+        from functools import partial
+
+        with _compress_pool(jobs, low_memory, max_decodes) as pool:
+            # map() yields in submission order, so output stays sorted
+            worker = partial(_compress_batch, final_hashes=final_hashes, trim=trim, max_error=max_error)
+            results = [r for batch in pool.map(worker, batches) for r in batch]
+    else:
+        # Act as the only worker, then put the caller's settings back
+        previous = (_LOW_MEMORY, _DECODE_SLOTS)
+        _init_compress_worker(low_memory)
+        try:
+            results = [r for batch in batches for r in _compress_batch(batch, final_hashes, trim, max_error)]
+        finally:
+            _init_compress_worker(*previous)
+
+    failed, skipped = _record_results(results, entries, final_hashes, stats)
+    save_compress_cache(cache, cache_path)
+
+    total = sum(p.stat().st_size for p in pngs if p.exists()) / 1024
     print(f"\nTotal size: {total:.1f} KB ({len(pngs)} files)")
+    if trim:
+        print(f"{sum(r[6] for r in results)} pixels cropped")
+    if skipped:
+        print(f"{skipped} file(s) already compressed (use --force to redo)")
+    if failed:
+        print(f"{failed} file(s) failed to compress")
+
+
+def _record_results(
+    results: list[CompressResult],
+    entries: dict[str, str],
+    final_hashes: frozenset[str],
+    stats: "RunStats | None" = None,
+) -> tuple[int, int]:
+    """Print per-file results and record new outputs in the cache. Returns (failed, skipped)."""
+    failed = skipped = 0
+    for path, size, src_hash, out_hash, error, seconds, cropped, palette in results:
+        if stats is not None:
+            stats.add(path, "compress_seconds", seconds)
+            stats.set(path, "bytes_written", size)
+            if cropped:
+                stats.set(path, "pixels_cropped", cropped)
+            if error is not None:
+                stats.set(path, "compress_error", error)
+        if error is not None:
+            failed += 1
+            print(f"  FAILED {path.name}: {error}")
+        elif src_hash in final_hashes:
+            skipped += 1
+            print(f"  Cached {path.name}: {size / 1024:.1f} KB")
+        else:
+            entries[src_hash] = out_hash
+            trimmed = f", {cropped} pixels cropped" if cropped else ""
+            palette = f" [{palette}]" if palette else ""
+            print(f"  Compressed {path.name}: {size / 1024:.1f} KB{trimmed}{palette}")
+    return failed, skipped
+
+
+class CompressionPipeline:
+    """Compress images in worker processes as soon as they are saved.
+
+    Generation threads hand each new file to submit() and keep going, so
+    compression overlaps with the next API call instead of waiting for the
+    whole run to finish.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        force: bool = False,
+        cache_path: Path = COMPRESS_CACHE,
+        stats: "RunStats | None" = None,
+        low_memory: bool = False,
+        max_decodes: int | None = None,
+        trim: bool = False,
+        max_error: float | None = None,
+    ):
+        self._stats = stats
+        self._settings = (trim, max_error)
+        self._cache_path = cache_path
+        self._cache = load_compress_cache(cache_path)
+        self._entries = self._cache.setdefault(_compress_settings_key(trim, max_error), {})
+        self._final_hashes = frozenset() if force else frozenset(self._entries.values())
+        self._pool = _compress_pool(jobs, low_memory, max_decodes)
+        self._futures: dict[Path, object] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, path: Path) -> None:
+        with self._lock:
+            self._futures[path] = self._pool.submit(_compress_one, path, self._final_hashes, *self._settings)
+
+    def submit_bytes(self, out_path: Path, raw: bytes) -> None:
+        """Compress raw response bytes straight to out_path (no full-size intermediate file)."""
+        with self._lock:
+            self._futures[out_path] = self._pool.submit(_compress_bytes_one, raw, out_path, *self._settings)
+
+    def finish(self) -> list[Path]:
+        """Wait for outstanding work, report in sorted order and return the compressed paths."""
+        self._pool.shutdown(wait=True)
+        paths = sorted(self._futures)
+        if not paths:
+            return []
+        print(f"\nCompressed {len(paths)} new image(s):")
+        results = [self._futures[p].result() for p in paths]
+        failed, _ = _record_results(results, self._entries, self._final_hashes, self._stats)
+        save_compress_cache(self._cache, self._cache_path)
+        if failed:
+            print(f"{failed} file(s) failed to compress")
+        return paths
 
 
 # ---------------------------------------------------------------------------
-# Generation
+# Palette optimization
 # ---------------------------------------------------------------------------
-def generate_image(client, prompt: str, reference_bytes=None):
-    """Call Gemini to generate an image. Returns (PIL Image, raw PNG bytes).
-    reference_bytes should be raw PNG bytes for style consistency."""
-    from PIL import Image
-    from google.genai import types
+def _to_luma(img):
+    """RGBA -> float luma array, composited over white like the app draws it."""
+    import numpy as np
 
-    full_prompt = STYLE_PREFIX + prompt
+    a = np.asarray(img.convert("RGBA"), dtype=np.float32)
+    alpha = a[..., 3:4] / 255.0
+    rgb = a[..., :3] * alpha + 255.0 * (1.0 - alpha)
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
 
-    contents: list = []
-    if reference_bytes is not None:
-        ref_part = types.Part.from_bytes(data=reference_bytes, mime_type="image/png")
-        contents.append(ref_part)
-        contents.append("Generate an image of the same character in a new pose. " + full_prompt)
-    else:
-        contents.append(full_prompt)
 
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            response = client.models.generate_content(
-                model="gemini-3.1-flash-image-preview",
-                contents=contents,
-            )
+def perceptual_error(reference, candidate, block: int = 8) -> float:
+    """1 - mean SSIM over non-overlapping block x block windows (0 = identical)."""
+    import numpy as np
 
-            # Extract image from response parts
-            for part in response.parts:
-                if part.inline_data is not None:
-                    raw = part.inline_data.data
-                    return Image.open(io.BytesIO(raw)), raw
+    x, y = _to_luma(reference), _to_luma(candidate)
+    h, w = (x.shape[0] // block) * block, (x.shape[1] // block) * block
+    x = x[:h, :w].reshape(h // block, block, w // block, block).swapaxes(1, 2)
+    y = y[:h, :w].reshape(h // block, block, w // block, block).swapaxes(1, 2)
 
-            print(f"  Warning: no image in response (attempt {attempt})")
-        except Exception as e:
-            print(f"  Error (attempt {attempt}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY * attempt)
+    mx, my = x.mean(axis=(2, 3)), y.mean(axis=(2, 3))
+    vx, vy = x.var(axis=(2, 3)), y.var(axis=(2, 3))
+    cov = ((x - mx[..., None, None]) * (y - my[..., None, None])).mean(axis=(2, 3))
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    ssim = ((2 * mx * my + c1) * (2 * cov + c2)) / ((mx**2 + my**2 + c1) * (vx + vy + c2))
+    return float(1.0 - ssim.mean())
 
-    raise RuntimeError(f"Failed to generate image after {MAX_RETRIES} attempts")
 
+def _palette_candidates(img):
+    """Yield (label, quantized image) for every palette size/method/dither combination."""
+    from PIL import Image, features
 
-def generate_group(
-    client,
-    items: list[tuple[str, str]],
-    root: Path,
-    group_name: str,
-    use_reference: bool = False,
-) -> None:
-    """Generate a group of images. If use_reference, the first image is used
-    as a reference for subsequent ones (mascot consistency)."""
-    print(f"\n{'='*60}")
-    print(f"Generating {group_name} ({len(items)} images)")
-    print(f"{'='*60}")
+    opaque = img.getextrema()[3][0] == 255
+    # MEDIANCUT/MAXCOVERAGE only work on RGB, so use them when alpha is unused
+    if opaque:
+        src = img.convert("RGB")
+        methods = [Image.Quantize.MEDIANCUT, Image.Quantize.MAXCOVERAGE, Image.Quantize.FASTOCTREE]
+    else:
+        src = img
+        methods = [Image.Quantize.FASTOCTREE]
+    if features.check("libimagequant"):
+        methods.append(Image.Quantize.LIBIMAGEQUANT)
 
-    reference_bytes = None
+    for colors in OPTIMIZE_COLORS:
+        for method in methods:
+            quantized = src.quantize(colors=colors, method=method, dither=Image.Dither.NONE)
+            yield f"{colors} colors, {method.name.lower()}", quantized
+            # Pillow only dithers when remapping onto a given palette (RGB sources only)
+            if opaque:
+                dithered = src.quantize(palette=quantized, dither=Image.Dither.FLOYDSTEINBERG)
+                yield f"{colors} colors, {method.name.lower()}, dithered", dithered
 
-    for i, (rel_path, prompt) in enumerate(items):
-        out_path = root / rel_path
-        out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if out_path.exists():
-            print(f"\n[{i+1}/{len(items)}] SKIP (exists): {rel_path}")
-            # If this is the first mascot, load its bytes as reference
-            if use_reference and i == 0:
-                reference_bytes = out_path.read_bytes()
+def _encoded_size(img) -> int:
+    buf = io.BytesIO()
+    _save_png(img, buf)
+    return buf.tell()
+
+
+def optimize_palette(img, max_error: float = MAX_PERCEPTUAL_ERROR) -> tuple[object, str]:
+    """Smallest palette encoding of img within max_error of it. Returns (image, description).
+
+    img is the unquantized RGBA image, so the budget bounds the total error
+    of the one quantization the asset goes through. The default _quantize
+    result competes too and is the fallback, so the search never does worse
+    than plain compression; the description reports the bytes saved over it.
+    """
+    default = _quantize(img)
+    default_size = _encoded_size(default)
+    best = (default_size, default, "default palette")
+    for label, candidate in _palette_candidates(img):
+        error = perceptual_error(img, candidate)
+        if error > max_error:
             continue
+        size = _encoded_size(candidate)
+        if size < best[0]:
+            best = (size, candidate, f"{label}, error {error:.4f}")
+    size, out, label = best
+    return out, f"{label}, saved {(default_size - size) / 1024:.1f} KB"
+
 
-        print(f"\n[{i+1}/{len(items)}] Generating: {rel_path}")
-        print(f"  Prompt: {prompt[:80]}...")
+# ---------------------------------------------------------------------------
+# Background removal and trimming
+# ---------------------------------------------------------------------------
+def _fill_runs(mask, seed):
+    """Grow seed along the last axis to every mask pixel in the same unbroken run."""
+    import numpy as np
 
-        ref = reference_bytes if use_reference else None
+    flat = mask.reshape(-1, mask.shape[-1])
+    # A new run id starts at every non-mask pixel and at the start of every line
+    starts = ~flat
+    starts[:, 0] = True
+    ids = np.cumsum(starts.ravel()) - 1
+    hit = np.bincount(ids, weights=(seed.reshape(flat.shape) & flat).ravel(), minlength=ids[-1] + 1) > 0
+    return hit[ids].reshape(mask.shape) & mask
 
-        img, raw_bytes = generate_image(client, prompt, reference_bytes=ref)
-        img.save(str(out_path))
-        print(f"  Saved: {out_path} ({out_path.stat().st_size / 1024:.1f} KB)")
 
-        # Store first mascot bytes as reference
-        if use_reference and i == 0:
-            reference_bytes = raw_bytes
+def border_connected(mask):
+    """Pixels of an (N, H, W) boolean batch connected to their image's border within mask.
 
-        # Rate limit — be polite to the API
-        time.sleep(2)
+    A flood fill done as alternating row and column sweeps: each sweep fills
+    whole runs at once, so it converges in as many sweeps as the fill has turns.
+    """
+    import numpy as np
+
+    seed = np.zeros_like(mask)
+    seed[:, [0, -1], :] = True
+    seed[:, :, [0, -1]] = True
+    seed &= mask
+    while True:
+        grown = _fill_runs(mask, seed)
+        grown = _fill_runs(mask.transpose(0, 2, 1), grown.transpose(0, 2, 1)).transpose(0, 2, 1)
+        if np.array_equal(grown, seed):
+            return seed
+        seed = grown
+
+
+def key_background(
+    batch, threshold: int = BACKGROUND_THRESHOLD, feather: int = BACKGROUND_FEATHER
+):
+    """Make the near-white background of an (N, H, W, 4) uint8 RGBA batch transparent.
+
+    Only light pixels connected to the border count as background, so white
+    inside the artwork (eyes, shirts) is kept. Edge pixels in the feather
+    band get partial alpha and have the white they were blended with
+    removed, which avoids a light halo on dark app backgrounds.
+    """
+    import numpy as np
+
+    rgba = batch.astype(np.float32)
+    lightness = rgba[..., :3].min(axis=-1)
+    background = border_connected(lightness >= threshold - feather)
+    keep = np.where(background, np.clip((threshold - lightness) / feather, 0.0, 1.0), 1.0)
+    alpha = rgba[..., 3] * keep
+    # Un-blend from white: c = (observed - 255 * (1 - a)) / a
+    a = keep[..., None]
+    rgb = np.where(a > 0, (rgba[..., :3] - 255.0 * (1.0 - a)) / np.maximum(a, 1e-6), 0.0)
+    out = np.concatenate([rgb, alpha[..., None]], axis=-1)
+    return np.clip(np.rint(out), 0, 255).astype(np.uint8)
+
+
+def content_boxes(batch, padding: int = TRIM_PADDING) -> list[tuple[int, int, int, int]]:
+    """(left, top, right, bottom) of the non-transparent content per image, plus padding.
+
+    Images with no visible pixels keep their full canvas.
+    """
+    import numpy as np
+
+    n, h, w = batch.shape[:3]
+    visible = batch[..., 3] > 0
+    rows, cols = visible.any(axis=2), visible.any(axis=1)
+    top, bottom = rows.argmax(axis=1), h - rows[:, ::-1].argmax(axis=1)
+    left, right = cols.argmax(axis=1), w - cols[:, ::-1].argmax(axis=1)
+    empty = ~rows.any(axis=1)
+    boxes = np.stack([
+        np.where(empty, 0, np.maximum(left - padding, 0)),
+        np.where(empty, 0, np.maximum(top - padding, 0)),
+        np.where(empty, w, np.minimum(right + padding, w)),
+        np.where(empty, h, np.minimum(bottom + padding, h)),
+    ], axis=1)
+    return [tuple(int(v) for v in box) for box in boxes]
+
+
+def trim_images(images: list) -> list:
+    """Key out the background and crop each PIL image to its content.
+
+    Same-sized images are stacked and processed as one NumPy batch.
+    """
+    import numpy as np
+    from PIL import Image
+
+    out: list = [None] * len(images)
+    by_size: dict[tuple[int, int], list[int]] = {}
+    for i, img in enumerate(images):
+        by_size.setdefault(img.size, []).append(i)
+    for indices in by_size.values():
+        batch = key_background(np.stack([np.asarray(images[i].convert("RGBA")) for i in indices]))
+        for i, arr, (left, top, right, bottom) in zip(indices, batch, content_boxes(batch)):
+            out[i] = Image.fromarray(arr[top:bottom, left:right], "RGBA")
+    return out
 
 
 # ---------------------------------------------------------------------------
-# Main
+# Atlas packing
 # ---------------------------------------------------------------------------
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate app images via Gemini API")
-    parser.add_argument("--api-key", help="Gemini API key (or set GEMINI_API_KEY env var)")
-    parser.add_argument(
-        "--only",
-        choices=["categories", "characters", "mascots", "scenarios"],
-        help="Generate only one group",
-    )
-    parser.add_argument(
-        "--compress-only",
-        action="store_true",
-        help="Skip generation, just compress existing PNGs",
-    )
-    args = parser.parse_args()
+def pack_shelves(
+    sizes: list[tuple[str, int, int]], max_side: int = ATLAS_MAX_SIZE, padding: int = ATLAS_PADDING
+) -> list[list[tuple[str, int, int, int, int]]]:
+    """Shelf-pack (name, w, h) rects into as few max_side squares as possible.
 
-    # Resolve project root (script lives in tools/)
-    root = Path(__file__).resolve().parent.parent
+    Returns one list of (name, x, y, w, h) per atlas. Rects are placed
+    tallest first, left to right, opening a new shelf (row) when the current
+    one is full and a new atlas when the shelves run out of height.
+    """
+    atlases: list[list[tuple[str, int, int, int, int]]] = []
+    current: list[tuple[str, int, int, int, int]] = []
+    x = y = shelf_h = 0
+    for name, w, h in sorted(sizes, key=lambda r: (-r[2], -r[1], r[0])):
+        if w > max_side or h > max_side:
+            raise ValueError(f"{name} ({w}x{h}) does not fit in a {max_side}px atlas")
+        if x + w > max_side:
+            x, y, shelf_h = 0, y + shelf_h + padding, 0
+        if y + h > max_side:
+            atlases.append(current)
+            current, x, y, shelf_h = [], 0, 0, 0
+        current.append((name, x, y, w, h))
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+    if current:
+        atlases.append(current)
+    return atlases
 
-    if args.compress_only:
-        compress_all(root / "assets" / "images")
-        return
 
-    # Resolve API key
-    api_key = args.api_key or os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        print("Error: provide --api-key or set GEMINI_API_KEY env var")
-        sys.exit(1)
+def build_atlas(root: Path, group: str, items: list[tuple[str, str]]) -> dict[str, tuple[str, int, int, int, int]]:
+    """Pack a group's compressed images into assets/atlases/<group>_<n>.png.
 
-    from google import genai
+    Returns {asset path: (atlas path, x, y, w, h)} keyed by the same paths
+    AppImages uses. When every sprite has density variants, the layout is
+    packed once in 1.0x pixels and each density gets its own atlas under
+    assets/atlases/<d>x/ with the same layout scaled by d, built from that
+    density's variants; regions stay in 1.0x (logical) pixels. Atlases are
+    quantized like any other asset.
+    """
+    from PIL import Image
 
-    client = genai.Client(api_key=api_key)
+    # Missing paths are aliased to another asset's file, which has its own region
+    present = [rel_path for rel_path, _ in items if (root / rel_path).exists()]
+    sources = {
+        density: {
+            rel_path: (root / rel_path).parent / _density_dir(density) / Path(rel_path).name
+            for rel_path in present
+        }
+        for density in DENSITIES
+    }
+    sources[1.0] = {rel_path: root / rel_path for rel_path in present}
+    densities = [d for d in DENSITIES if all(p.exists() for p in sources[d].values())]
+    top = max(densities)
 
-    groups = {
-        "categories": (CATEGORIES, "Categories", False),
-        "characters": (CHARACTERS, "Characters", False),
-        "mascots": (MASCOTS, "Mascots (with reference)", True),
-        "scenarios": (SCENARIOS, "Scenarios", False),
+    sizes = []
+    for rel_path in present:
+        with Image.open(root / rel_path) as img:
+            sizes.append((rel_path, img.width, img.height))
+
+    out_dir = root / ATLAS_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in [*out_dir.glob(f"{group}_*.png"), *out_dir.glob(f"*x/{group}_*.png")]:
+        stale.unlink()
+
+    regions = {}
+    # Rounding can make a variant up to d pixels larger than its 1.0x size
+    # times d; the padding (also scaled by d) absorbs that, and max_side keeps
+    # the densest atlas within ATLAS_MAX_SIZE
+    max_side = ATLAS_MAX_SIZE if top == 1.0 else int(ATLAS_MAX_SIZE // top) - 1
+    for n, placed in enumerate(pack_shelves(sizes, max_side=max_side)):
+        atlas_rel = f"{ATLAS_DIR}/{group}_{n}.png"
+        for density in densities:
+            dest = root / atlas_rel if density == 1.0 else out_dir / _density_dir(density) / f"{group}_{n}.png"
+            dest.parent.mkdir(exist_ok=True)
+            sprites = []
+            for rel_path, x, y, _, _ in placed:
+                with Image.open(sources[density][rel_path]) as img:
+                    sprites.append((img.convert("RGBA"), round(x * density), round(y * density)))
+            width = max(x + img.width for img, x, _ in sprites)
+            height = max(y + img.height for img, _, y in sprites)
+            atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+            for img, x, y in sprites:
+                atlas.paste(img, (x, y))
+            _save_png(_quantize(atlas), dest)
+            print(f"  {dest.relative_to(root)}: {len(placed)} sprites, {atlas.width}x{atlas.height}, "
+                  f"{dest.stat().st_size / 1024:.1f} KB")
+        for rel_path, x, y, w, h in placed:
+            regions[rel_path] = (atlas_rel, x, y, w, h)
+    return regions
+
+
+def write_atlas_dart(path: Path, regions: dict[str, tuple[str, int, int, int, int]]) -> None:
+    """Generate the Dart index of atlas sub-rectangles, keyed by AppImages path."""
+    lines = [
+        "// GENERATED by tools/generate_images.py --atlas. Do not edit by hand.",
+        "",
+        "/// A sprite's location inside a packed atlas image, in pixels of the 1.0x",
+        "/// atlas. Its 2.0x/ and 3.0x/ variants, when present, use the same layout",
+        "/// scaled by their density.",
+        "class AtlasRegion {",
+        "  const AtlasRegion(this.atlas, this.x, this.y, this.width, this.height);",
+        "",
+        "  final String atlas;",
+        "  final int x;",
+        "  final int y;",
+        "  final int width;",
+        "  final int height;",
+        "}",
+        "",
+        "/// Atlas regions keyed by the same paths as the `AppImages` constants.",
+        "class AppAtlases {",
+        "  AppAtlases._();",
+        "",
+        "  static const regions = <String, AtlasRegion>{",
+    ]
+    for rel_path, (atlas, x, y, w, h) in sorted(regions.items()):
+        lines.append(f"    '{rel_path}': AtlasRegion('{atlas}', {x}, {y}, {w}, {h}),")
+    lines += ["  };", "}", ""]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines))
+
+
+def read_atlas_dart(path: Path) -> dict[str, tuple[str, int, int, int, int]]:
+    """Parse the regions back out of a Dart index written by write_atlas_dart."""
+    import re
+
+    if not path.exists():
+        return {}
+    pattern = r"'([^']+)': AtlasRegion\('([^']+)', (\d+), (\d+), (\d+), (\d+)\),"
+    return {
+        rel_path: (atlas, int(x), int(y), int(w), int(h))
+        for rel_path, atlas, x, y, w, h in re.findall(pattern, path.read_text())
+    }
+
+
+def build_atlases(root: Path, groups: dict[str, list[tuple[str, str]]]) -> None:
+    """Pack each group into atlases and regenerate the Dart index.
+
+    Regions of groups packed by earlier runs are kept, as long as their
+    atlas image still exists, so the index always covers every atlas on disk.
+    """
+    rebuilt = tuple(f"{ATLAS_DIR}/{group}_" for group in groups)
+    regions = {
+        rel_path: region
+        for rel_path, region in read_atlas_dart(root / ATLAS_DART).items()
+        if not region[0].startswith(rebuilt) and (root / region[0]).exists()
     }
+    for group, items in groups.items():
+        print(f"\nPacking {group} atlas ({len(items)} images)...")
+        regions.update(build_atlas(root, group, items))
+    write_atlas_dart(root / ATLAS_DART, regions)
+    print(f"\nWrote {ATLAS_DART} ({len(regions)} regions)")
+    print(f"Remember to list {ATLAS_DIR}/ under flutter: assets: in pubspec.yaml")
+
+
+# ---------------------------------------------------------------------------
+# Placeholders and image metadata
+# ---------------------------------------------------------------------------
+def dominant_color(img) -> int:
+    """Most common opaque, non-background colour as 0xAARRGGBB (white if none)."""
+    import numpy as np
+
+    small = img.convert("RGBA")
+    small.thumbnail((64, 64))
+    px = np.asarray(small).reshape(-1, 4).astype(np.int32)
+    # Ignore transparent pixels and the near-white background the prompts ask for
+    px = px[(px[:, 3] > 127) & (px[:, :3].min(axis=1) < 235)]
+    if len(px) == 0:
+        return 0xFFFFFFFF
+    # Bucket at 4 bits per channel, then average the winning bucket
+    buckets = (px[:, 0] >> 4) << 8 | (px[:, 1] >> 4) << 4 | (px[:, 2] >> 4)
+    winner = np.bincount(buckets).argmax()
+    r, g, b = px[buckets == winner, :3].mean(axis=0).round().astype(int)
+    return 0xFF000000 | int(r) << 16 | int(g) << 8 | int(b)
+
+
+def placeholder_data(path: Path) -> tuple[int, int, int, str]:
+    """(width, height, dominant colour, base64 PNG thumbnail) for one image."""
+    import base64
+
+    from PIL import Image
+
+    with Image.open(path) as img:
+        width, height = img.size
+        img = img.convert("RGBA")
+        color = dominant_color(img)
+        img.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE), Image.Resampling.BOX)
+        buf = io.BytesIO()
+        img.quantize(colors=32, method=Image.Quantize.FASTOCTREE).save(buf, "PNG", optimize=True)
+    return width, height, color, base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def write_image_meta(root: Path, items: list[tuple[str, str]]) -> None:
+    """Generate the Dart table of sizes, dominant colours and inline placeholders.
+
+    Sizes are read from the files on disk, so call this after every step that
+    rewrites them (compression, variants).
+    """
+    lines = [
+        "// GENERATED by tools/generate_images.py. Do not edit by hand.",
+        "",
+        "import 'dart:ui' show Color;",
+        "",
+        "/// Build-time facts about an asset, available before it is decoded.",
+        "class ImageMeta {",
+        "  const ImageMeta(this.width, this.height, this.dominantColor, this.placeholder);",
+        "",
+        "  final int width;",
+        "  final int height;",
+        "  final Color dominantColor;",
+        "",
+        "  /// Base64 PNG thumbnail; decode with `base64Decode` for `Image.memory`.",
+        "  final String placeholder;",
+        "",
+        "  double get aspectRatio => width / height;",
+        "}",
+        "",
+        "/// Image metadata keyed by the same paths as the `AppImages` constants.",
+        "class AppImageMeta {",
+        "  AppImageMeta._();",
+        "",
+        "  static const all = <String, ImageMeta>{",
+    ]
+    count = 0
+    for rel_path in sorted({rel_path for rel_path, _ in items}):
+        if not (root / rel_path).exists():
+            continue
+        width, height, color, thumb = placeholder_data(root / rel_path)
+        lines.append(f"    '{rel_path}': ImageMeta({width}, {height}, Color(0x{color:08X}), '{thumb}'),")
+        count += 1
+    lines += ["  };", "}", ""]
+    (root / IMAGE_META_DART).parent.mkdir(parents=True, exist_ok=True)
+    (root / IMAGE_META_DART).write_text("\n".join(lines))
+    print(f"\nWrote {IMAGE_META_DART} ({count} images)")
+
+
+# ---------------------------------------------------------------------------
+# Duplicate detection
+# ---------------------------------------------------------------------------
+# Manifest marker for an asset to regenerate because it duplicated another
+STALE_DUPLICATE = "duplicate"
+
+
+def _hash_bits(bits) -> int:
+    value = 0
+    for bit in bits.ravel():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def average_hash(img, size: int = 8) -> int:
+    """aHash: which cells of a size x size luma thumbnail are brighter than the mean."""
+    from PIL import Image
+
+    luma = _to_luma(img.resize((size, size), Image.Resampling.BOX))
+    return _hash_bits(luma > luma.mean())
+
+
+def perceptual_hash(img, size: int = 8, scale: int = 4) -> int:
+    """pHash: signs of the lowest size x size DCT coefficients of a small luma thumbnail,
+    relative to their median. Robust to re-encoding, small shifts and colour tweaks."""
+    import numpy as np
+    from PIL import Image
 
-    if args.only:
-        items, name, use_ref = groups[args.only]
-        generate_group(client, items, root, name, use_reference=use_ref)
+    n = size * scale
+    luma = _to_luma(img.resize((n, n), Image.Resampling.BOX))
+    # Orthonormal DCT-II basis; two matrix products give the 2-D transform
+    k = np.arange(n)
+    basis = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * np.sqrt(2.0 / n)
+    basis[0] /= np.sqrt(2.0)
+    low = (basis @ luma @ basis.T)[:size, :size]
+    return _hash_bits(low > np.median(low))
+
+
+class HashIndex:
+    """Multi-index hashing for Hamming-distance lookups on 64-bit hashes.
+
+    Each hash is split into max_distance + 1 bands, one lookup table per
+    band. Two hashes within max_distance bits must agree exactly on at
+    least one band (pigeonhole), so near() only compares candidates that
+    share a band instead of scanning everything.
+    """
+
+    def __init__(self, max_distance: int = DEDUP_MAX_DISTANCE, bits: int = 64):
+        bands = max_distance + 1
+        self.max_distance = max_distance
+        self._bands = [(bits * i // bands, bits * (i + 1) // bands) for i in range(bands)]
+        self._tables: list[dict[int, list[tuple[str, int]]]] = [{} for _ in self._bands]
+
+    def _keys(self, value: int):
+        for table, (lo, hi) in zip(self._tables, self._bands):
+            yield table, (value >> lo) & ((1 << (hi - lo)) - 1)
+
+    def add(self, name: str, value: int) -> None:
+        for table, key in self._keys(value):
+            table.setdefault(key, []).append((name, value))
+
+    def near(self, value: int) -> list[tuple[str, int]]:
+        """[(name, distance)] of indexed hashes within max_distance bits."""
+        found = {}
+        for table, key in self._keys(value):
+            for name, other in table.get(key, ()):
+                if name not in found:
+                    found[name] = (value ^ other).bit_count()
+        return sorted((name, d) for name, d in found.items() if d <= self.max_distance)
+
+
+def _fingerprint_one(path: Path) -> tuple[Path, str, int, int, str | None]:
+    """Worker entry point: (path, sha256, aHash, pHash, error)."""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as img:
+            img.load()
+            return path, _file_digest(path), average_hash(img), perceptual_hash(img), None
+    except Exception as e:
+        return path, "", 0, 0, f"{type(e).__name__}: {e}"
+
+
+def find_duplicates(
+    root: Path, items: list[tuple[str, str]], jobs: int = 1, max_distance: int = DEDUP_MAX_DISTANCE
+) -> tuple[list[list[str]], list[list[str]]]:
+    """Group assets that are byte-identical or perceptually near-identical.
+
+    Returns (exact, near): lists of clusters, each in items order so the
+    first entry is the one to keep. Near clusters are connected components
+    of pairs whose aHash and pHash are both within max_distance bits;
+    exact duplicates are left out of them.
+    """
+    order = {rel_path: i for i, (rel_path, _) in reversed(list(enumerate(items)))}
+    paths = [root / rel_path for rel_path in order if (root / rel_path).exists()]
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_fingerprint_one, paths))
     else:
-        for key in ["categories", "characters", "mascots", "scenarios"]:
-            items, name, use_ref = groups[key]
-            generate_group(client, items, root, name, use_reference=use_ref)
+        results = [_fingerprint_one(p) for p in paths]
 
-    # Compress all generated images
-    compress_all(root / "assets" / "images")
+    by_digest: dict[str, list[str]] = {}
+    ahashes: dict[str, int] = {}
+    index = HashIndex(max_distance)
+    parent: dict[str, str] = {}
 
-    # Summary
-    pngs = list((root / "assets" / "images").rglob("*.png"))
-    print(f"\n{'='*60}")
-    print(f"Done! {len(pngs)} images generated.")
-    total_kb = sum(p.stat().st_size for p in pngs) / 1024
-    print(f"Total size: {total_kb:.1f} KB")
-    print(f"{'='*60}")
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for path, digest, ahash, phash, error in results:
+        rel_path = str(path.relative_to(root))
+        if error is not None:
+            print(f"  FAILED {rel_path}: {error}")
+            continue
+        by_digest.setdefault(digest, []).append(rel_path)
+        if len(by_digest[digest]) > 1:
+            continue  # Identical to an asset already indexed
+        parent[rel_path] = rel_path
+        for other, _ in index.near(phash):
+            if (ahash ^ ahashes[other]).bit_count() <= max_distance:
+                parent[find(rel_path)] = find(other)
+        index.add(rel_path, phash)
+        ahashes[rel_path] = ahash
+
+    clusters: dict[str, list[str]] = {}
+    for rel_path in parent:
+        clusters.setdefault(find(rel_path), []).append(rel_path)
+    near = [sorted(c, key=order.get) for c in clusters.values() if len(c) > 1]
+    exact = [sorted(c, key=order.get) for c in by_digest.values() if len(c) > 1]
+    return sorted(exact, key=lambda c: order[c[0]]), sorted(near, key=lambda c: order[c[0]])
+
+
+def load_aliases(path: Path = ALIASES) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_aliases(aliases: dict[str, str], path: Path = ALIASES) -> None:
+    path.write_text(json.dumps(aliases, indent=2, sort_keys=True) + "\n")
+
+
+def share_duplicates(root: Path, clusters: list[list[str]], aliases: dict[str, str]) -> int:
+    """Point every exact duplicate at its cluster's first asset. Returns bytes freed.
+
+    The duplicate's literal in app_images.dart is rewritten to the shared
+    path, its files (and density variants) are deleted, and aliases records
+    it so generation and --verify leave it alone. Remove an entry from
+    tools/images.aliases.json (and restore the Dart path) to split it again.
+    """
+    dart_path = root / APP_IMAGES_DART
+    dart = dart_path.read_text() if dart_path.exists() else None
+    freed = 0
+    for keep, *duplicates in clusters:
+        for rel_path in duplicates:
+            path = root / rel_path
+            for f in [path] + variant_paths(path):
+                if f.exists():
+                    freed += f.stat().st_size
+                    f.unlink()
+            if dart is not None:
+                dart = dart.replace(f"'{rel_path}'", f"'{keep}'")
+            aliases[rel_path] = keep
+            print(f"  Shared {rel_path} -> {keep}")
+    if dart is not None:
+        dart_path.write_text(dart)
+    return freed
+
+
+def dedup_assets(
+    root: Path,
+    items: list[tuple[str, str]],
+    manifest: dict[str, str],
+    aliases: dict[str, str],
+    jobs: int = 1,
+    max_distance: int = DEDUP_MAX_DISTANCE,
+    regenerate: bool = False,
+) -> list[str]:
+    """Report duplicate clusters, share exact duplicates and, with regenerate,
+    mark the rest of each near-duplicate cluster stale in manifest.
+
+    Returns the assets marked for regeneration; generate_group rebuilds them
+    without consulting the response cache, which would only replay the
+    duplicate.
+    """
+    print(f"\nChecking {len(items)} images for duplicates (max distance {max_distance} bits)...")
+    exact, near = find_duplicates(root, items, jobs, max_distance)
+    for cluster in near:
+        print(f"  Near duplicates: {', '.join(cluster)}")
+    for cluster in exact:
+        print(f"  Identical: {', '.join(cluster)}")
+    freed = share_duplicates(root, exact, aliases)
+
+    stale = []
+    if regenerate:
+        for _, *duplicates in near:
+            for rel_path in duplicates:
+                manifest[rel_path] = STALE_DUPLICATE
+                stale.append(rel_path)
+    print(
+        f"\n{len(near)} near-duplicate cluster(s), {sum(len(c) - 1 for c in exact)} identical file(s) shared "
+        f"({freed / 1024:.1f} KB freed), {len(stale)} marked for regeneration"
+    )
+    return stale
+
+
+# ---------------------------------------------------------------------------
+# Verification
+# ---------------------------------------------------------------------------
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_TYPES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+# The compressor only writes palette PNGs; truecolour means the file skipped it
+PNG_PALETTE = 3
+
+
+def png_header(path: Path) -> tuple[int, int, int, int]:
+    """(width, height, bit depth, colour type) from the IHDR chunk, without decoding."""
+    import struct
+
+    with open(path, "rb") as f:
+        head = f.read(26)
+    if len(head) < 26 or head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        raise ValueError("not a PNG")
+    return struct.unpack(">IIBB", head[16:26])
+
+
+def dart_asset_paths(path: Path) -> set[str]:
+    """Every 'assets/images/....png' string literal in a Dart file."""
+    import re
+
+    return set(re.findall(r"'(assets/images/[^']+\.png)'", path.read_text()))
+
+
+def _verify_one(path: Path, longest: int, max_file_bytes: int) -> tuple[int, list[str]]:
+    """Check one file's header against the largest allowed side. Returns (bytes, problems)."""
+    if not path.exists():
+        return 0, ["missing"]
+    size = path.stat().st_size
+    try:
+        width, height, depth, color_type = png_header(path)
+    except (OSError, ValueError) as e:
+        return size, [f"unreadable: {e}"]
+    problems = []
+    if max(width, height) > longest:
+        # Raw API output is 1024px+; nothing that went through compress_image is
+        problems.append(f"never compressed: {width}x{height}, expected at most {longest}px")
+    if color_type in (2, 6):
+        problems.append(f"never compressed: {PNG_COLOR_TYPES[color_type]}, expected a palette PNG")
+    elif color_type != PNG_PALETTE or depth > 8:
+        mode = PNG_COLOR_TYPES.get(color_type, f"colour type {color_type}")
+        problems.append(f"unexpected mode: {mode}, {depth}-bit")
+    if size > max_file_bytes:
+        problems.append(f"{size / 1024:.1f} KB over the {max_file_bytes / 1024:.0f} KB budget")
+    return size, problems
+
+
+def verify_assets(
+    root: Path,
+    items: list[tuple[str, str]],
+    max_file_bytes: int = MAX_FILE_BYTES,
+    max_total_bytes: int = MAX_TOTAL_BYTES,
+    aliases: dict[str, str] | None = None,
+) -> list[str]:
+    """Check the generated assets without decoding any of them. Returns the problems found.
+
+    Every listed path must exist, be listed once, match a constant in
+    app_images.dart (and vice versa) and have no unlisted neighbours.
+    Each file must be an 8-bit palette PNG no larger than MAX_SIZE (or its
+    density-variant size) and within max_file_bytes, and all of them
+    together within max_total_bytes.
+    Aliased assets only need their shared file to pass. Headers are read
+    in parallel on a thread pool.
+    """
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+
+    problems = []
+    listed = [rel_path for rel_path, _ in items]
+    for rel_path, count in sorted(Counter(listed).items()):
+        if count > 1:
+            problems.append(f"{rel_path}: listed {count} times")
+    if aliases is None:
+        aliases = {}
+    for rel_path, target in sorted(aliases.items()):
+        if target not in listed or target in aliases:
+            problems.append(f"{rel_path}: aliased to {target}, which is not a generated asset")
+    listed = [rel_path for rel_path in listed if rel_path not in aliases]
+    dart = dart_asset_paths(root / APP_IMAGES_DART)
+    for rel_path in sorted(set(listed) - dart):
+        problems.append(f"{rel_path}: not referenced in {APP_IMAGES_DART}")
+    for rel_path in sorted(dart - set(listed)):
+        problems.append(f"{rel_path}: in {APP_IMAGES_DART} but nothing generates it")
+    on_disk = {str(p.relative_to(root)) for p in source_pngs(root / "assets" / "images")}
+    for rel_path in sorted(on_disk - set(listed)):
+        problems.append(f"{rel_path}: unlisted file in the asset bundle")
+
+    # Density variants, when present, make the base the 1.0x rendition
+    top = max(DENSITIES)
+    checks: list[tuple[Path, int]] = []
+    for rel_path in sorted(set(listed)):
+        path = root / rel_path
+        variants = [(d, path.parent / _density_dir(d) / path.name) for d in DENSITIES if d != 1.0]
+        if any(p.exists() for _, p in variants):
+            checks.append((path, round(MAX_SIZE / top)))
+            checks += [(p, round(MAX_SIZE * d / top)) for d, p in variants]
+        else:
+            checks.append((path, MAX_SIZE))
+
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(lambda check: _verify_one(*check, max_file_bytes), checks))
+    total = 0
+    for (path, _), (size, file_problems) in zip(checks, results):
+        total += size
+        problems += [f"{path.relative_to(root)}: {problem}" for problem in file_problems]
+    if total > max_total_bytes:
+        problems.append(f"total {total / 1024:.1f} KB over the {max_total_bytes / 1024:.0f} KB budget")
+
+    for problem in problems:
+        print(f"  {problem}")
+    print(f"\nVerified {len(checks)} files, {total / 1024:.1f} KB total: {len(problems)} problem(s)")
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Run instrumentation
+# ---------------------------------------------------------------------------
+def peak_rss_kb() -> dict[str, int]:
+    """Peak resident set size of this process and of its largest finished child, in KB.
+
+    Empty where the resource module is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return {}
+
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    scale = 1024 if sys.platform == "darwin" else 1
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    }
+
+
+class RunStats:
+    """Thread-safe per-asset metrics for one run, written out as a JSON report.
+
+    Metrics ending in _seconds, api_calls, retries etc. accumulate via add();
+    set() overwrites (sizes, error messages). Assets are keyed by their path
+    relative to root.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.started = datetime.datetime.now(datetime.timezone.utc)
+        self._start = time.perf_counter()
+        self._assets: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, asset: str | Path) -> str:
+        path = Path(asset)
+        if path.is_absolute() and path.is_relative_to(self.root):
+            return str(path.relative_to(self.root))
+        return str(asset)
+
+    def add(self, asset: str | Path, metric: str, value: float = 1) -> None:
+        with self._lock:
+            metrics = self._assets.setdefault(self._key(asset), {})
+            metrics[metric] = metrics.get(metric, 0) + value
+
+    def set(self, asset: str | Path, metric: str, value) -> None:
+        with self._lock:
+            self._assets.setdefault(self._key(asset), {})[metric] = value
+
+    @contextmanager
+    def timed(self, asset: str | Path, metric: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(asset, metric, time.perf_counter() - start)
+
+    def report(self) -> dict:
+        with self._lock:
+            assets = {k: dict(v) for k, v in sorted(self._assets.items())}
+        totals: dict[str, float] = {}
+        for metrics in assets.values():
+            for metric, value in metrics.items():
+                if isinstance(value, (int, float)):
+                    totals[metric] = totals.get(metric, 0) + value
+        report = {
+            "started": self.started.isoformat(timespec="seconds"),
+            "wall_seconds": time.perf_counter() - self._start,
+            "settings": {
+                "max_retries": MAX_RETRIES,
+                "retry_delay": RETRY_DELAY,
+                "retry_max_delay": RETRY_MAX_DELAY,
+            },
+            "totals": totals,
+            "assets": assets,
+        }
+        rss = peak_rss_kb()
+        if rss:
+            report["peak_rss_kb"] = rss
+        return report
+
+    def write(self, path: Path | None = None, directory: Path = REPORTS_DIR) -> Path:
+        """Write the JSON report (default: <directory>/run-<timestamp>.json, tools/reports)."""
+        if path is None:
+            path = directory / f"run-{self.started:%Y%m%dT%H%M%SZ}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n")
+        return path
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `burst` banked."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available, then take it. Returns seconds waited."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+# Throttling, timeouts and server-side failures; anything else 4xx is our fault
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class BackendError(Exception):
+    """A failed backend call. `status` is the HTTP status, if there was one;
+    `retry_after` is the delay in seconds the server asked for, if any."""
+
+    def __init__(self, message: str, status: int | None = None, retry_after: float | None = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transport problems, throttling and server errors are worth another try;
+    bad requests, auth failures and bugs in this script are not."""
+    if isinstance(error, BackendError):
+        return error.status is None or error.status in RETRYABLE_STATUS
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def retry_after_hint(error: Exception) -> float | None:
+    """Seconds the server asked us to wait, from a Retry-After header or a
+    google.rpc.RetryInfo error detail ("17s")."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            from email.utils import parsedate_to_datetime
+
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                now = datetime.datetime.now(datetime.timezone.utc)
+                return max(0.0, (when - now).total_seconds())
+    body = getattr(error, "details", None)
+    if isinstance(body, dict):
+        body = body.get("error", body)
+        for detail in body.get("details", []) if isinstance(body, dict) else []:
+            if isinstance(detail, dict) and detail.get("@type", "").endswith("RetryInfo"):
+                try:
+                    return max(0.0, float(str(detail.get("retryDelay", "")).rstrip("s")))
+                except ValueError:
+                    pass
+    return None
+
+
+class CircuitBreaker:
+    """Thread-safe breaker that pauses every worker when API calls keep failing.
+
+    Remembers the outcome of the last `window` calls. Once at least
+    `min_calls` are recorded and `threshold` of them failed, the breaker
+    opens for `cooldown` seconds; wait() blocks all callers until it closes
+    and the window starts over. pause() opens it directly, for server
+    retry-after hints that apply to the whole API key.
+    """
+
+    def __init__(
+        self,
+        threshold: float = BREAKER_THRESHOLD,
+        window: int = BREAKER_WINDOW,
+        cooldown: float = BREAKER_COOLDOWN,
+        min_calls: int = 5,
+    ):
+        from collections import deque
+
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.min_calls = min_calls
+        self.trips = 0
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._outcomes.append(ok)
+            calls = len(self._outcomes)
+            if calls >= self.min_calls and self._outcomes.count(False) >= self.threshold * calls:
+                self._open(self.cooldown, f"{self._outcomes.count(False)}/{calls} recent calls failed")
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._open(seconds, "server asked to retry later")
+
+    def _open(self, seconds: float, reason: str) -> None:
+        until = time.monotonic() + seconds
+        if until > self._open_until:
+            self._open_until = until
+            self.trips += 1
+            print(f"  Circuit open ({reason}): pausing all workers for {seconds:.1f}s")
+        self._outcomes.clear()
+
+    def wait(self) -> float:
+        """Block while the breaker is open. Returns seconds waited."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return time.monotonic() - start
+            time.sleep(remaining)
+
+
+class RetryPolicy:
+    """Exponential back-off with full jitter for generate_image.
+
+    Retry n sleeps a random time in [0, min(max_delay, base_delay * 2**(n-1))]
+    so workers that failed together do not retry together; a server
+    retry-after hint is a lower bound. Every call outcome is reported to
+    `breaker`, if given. Pass a seed for reproducible delays in tests.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRIES,
+        base_delay: float = RETRY_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        breaker: CircuitBreaker | None = None,
+        seed: int | None = None,
+    ):
+        import random
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to sleep after failed attempt number `attempt` (1-based)."""
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        with self._lock:
+            wait = self._rng.uniform(0, cap)
+        return max(wait, retry_after or 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+def asset_input_hash(prompt: str, reference_hash: str | None = None) -> str:
+    """Hash of everything that determines an asset: style, prompt, model and reference."""
+    h = hashlib.sha256()
+    for part in (STYLE_PREFIX, prompt, MODEL, reference_hash or ""):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def load_manifest(path: Path = MANIFEST) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, str], path: Path = MANIFEST) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def plan_group(
+    items: list[tuple[str, str]],
+    root: Path,
+    manifest: dict[str, str],
+    use_reference: bool = False,
+    aliases: dict[str, str] | None = None,
+) -> list[tuple[str, str, str]]:
+    """Return (rel_path, input_hash, status) per item; status is "ok", "missing" or "changed".
+
+    With use_reference, every later item depends on the first item's input
+    hash, so editing the reference prompt rebuilds the whole group. Existing
+    files with no manifest entry are adopted as "ok" rather than rebuilt,
+    and aliased assets are always "ok".
+    """
+    plan = []
+    reference_hash = None
+    for i, (rel_path, prompt) in enumerate(items):
+        input_hash = asset_input_hash(prompt, reference_hash if use_reference and i > 0 else None)
+        if use_reference and i == 0:
+            reference_hash = input_hash
+        if aliases and rel_path in aliases:
+            status = "ok"
+        elif not (root / rel_path).exists():
+            status = "missing"
+        elif manifest.get(rel_path, input_hash) != input_hash:
+            status = "changed"
+        else:
+            status = "ok"
+        plan.append((rel_path, input_hash, status))
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Job journal
+# ---------------------------------------------------------------------------
+class JobJournal:
+    """Append-only JSONL record of each asset's state: pending, in-flight, done or failed.
+
+    Every transition is flushed as its own line, so a crashed or interrupted
+    run leaves an accurate picture for --resume. The last line per asset wins.
+    """
+
+    STATES = ("pending", "in-flight", "done", "failed")
+
+    def __init__(self, path: Path = JOURNAL, fresh: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        if fresh:
+            path.write_text("")
+
+    def record(self, asset: str, state: str, error: str | None = None) -> None:
+        entry = {"asset": asset, "state": state, "time": time.time()}
+        if error is not None:
+            entry["error"] = error
+        with self._lock, self.path.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def states(self) -> dict[str, dict]:
+        """Latest entry per asset; unreadable trailing lines (e.g. from a crash) are ignored."""
+        latest: dict[str, dict] = {}
+        try:
+            lines = self.path.read_text().splitlines()
+        except OSError:
+            return latest
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            latest[entry["asset"]] = entry
+        return latest
+
+    def unfinished(self) -> set[str]:
+        return {asset for asset, entry in self.states().items() if entry["state"] != "done"}
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+class ResponseCache:
+    """Content-addressed store of raw API responses with size-bounded LRU eviction.
+
+    Entries are <request hash>.bin files; a hit refreshes the file's mtime,
+    and the least recently used files are evicted once the directory grows
+    past max_bytes. Pointing --cache-dir at a saved directory replays a run
+    offline.
+    """
+
+    def __init__(self, directory: Path = RESPONSE_CACHE_DIR, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(model: str, prompt_text: str, reference_bytes: bytes | None = None) -> str:
+        """Hash of the full request: model, prompt text and reference image bytes."""
+        h = hashlib.sha256()
+        h.update(model.encode() + b"\0" + prompt_text.encode() + b"\0")
+        if reference_bytes is not None:
+            h.update(hashlib.sha256(reference_bytes).digest())
+        return h.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        path = self.directory / f"{key}.bin"
+        with self._lock:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                return None
+            os.utime(path)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            tmp = self.directory / f"{key}.tmp"
+            tmp.write_bytes(data)
+            tmp.replace(self.directory / f"{key}.bin")
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = [(p.stat(), p) for p in self.directory.glob("*.bin")]
+        total = sum(st.st_size for st, _ in entries)
+        for st, path in sorted(entries, key=lambda e: e[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+class ImageBackend(ABC):
+    """Something that turns a prompt (plus optional reference PNG) into image bytes.
+
+    generate() returns the raw image bytes, or None when the service answered
+    without an image; failed calls raise, preferably BackendError so the
+    retry policy can tell throttling from fatal errors. `model` identifies the
+    backend in response-cache keys.
+    """
+
+    model = ""
+
+    @abstractmethod
+    def generate(self, text: str, reference_bytes: bytes | None = None) -> bytes | None:
+        ...
+
+
+class GeminiBackend(ImageBackend):
+    """google.genai image generation."""
+
+    def __init__(self, api_key: str, model: str = MODEL):
+        from google import genai
+
+        self.model = model
+        self._client = genai.Client(api_key=api_key)
+
+    def generate(self, text: str, reference_bytes: bytes | None = None) -> bytes | None:
+        contents: list = []
+        if reference_bytes is not None:
+            from google.genai import types
+
+            contents.append(types.Part.from_bytes(data=reference_bytes, mime_type="image/png"))
+        contents.append(text)
+
+        import httpx
+        from google.genai import errors
+
+        try:
+            response = self._client.models.generate_content(model=self.model, contents=contents)
+        except errors.APIError as e:
+            raise BackendError(str(e), status=e.code, retry_after=retry_after_hint(e)) from e
+        except httpx.TransportError as e:
+            raise BackendError(f"{type(e).__name__}: {e}") from e
+        # Extract image from response parts
+        for part in response.parts or []:
+            if part.inline_data is not None:
+                return part.inline_data.data
+        return None
+
+
+def render_synthetic(seed: str, size: int = 1024) -> bytes:
+    """Deterministic flat vector-style PNG: white background and a few solid shapes."""
+    import random
+
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(hashlib.sha256(seed.encode()).digest())
+    img = Image.new("RGBA", (size, size), "white")
+    draw = ImageDraw.Draw(img)
+    for _ in range(rng.randint(4, 12)):
+        color = tuple(rng.randrange(256) for _ in range(3))
+        x0, y0 = rng.randrange(size), rng.randrange(size)
+        x1, y1 = x0 + rng.randrange(size // 8, size // 2), y0 + rng.randrange(size // 8, size // 2)
+        box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        if rng.random() < 0.5:
+            draw.ellipse(box, fill=color)
+        else:
+            draw.rounded_rectangle(box, radius=size // 20, fill=color)
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+class StubBackend(ImageBackend):
+    """Offline stand-in that renders synthetic images with injected latency and failures.
+
+    Images depend only on the request text (and reference), so runs are
+    reproducible. Failures are drawn from a seeded RNG: a `failure_rate`
+    share of calls raise ConnectionError, `throttle_rate` are rejected with
+    429 and a `retry_after` hint, `fatal_rate` with a non-retryable 400, and
+    `empty_rate` return no image.
+    """
+
+    model = "stub"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        empty_rate: float = 0.0,
+        size: int = 1024,
+        seed: int = 0,
+        throttle_rate: float = 0.0,
+        fatal_rate: float = 0.0,
+        retry_after: float = 1.0,
+    ):
+        import random
+
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.empty_rate = empty_rate
+        self.throttle_rate = throttle_rate
+        self.fatal_rate = fatal_rate
+        self.retry_after = retry_after
+        self.size = size
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate(self, text: str, reference_bytes: bytes | None = None) -> bytes | None:
+        with self._lock:
+            roll = self._rng.random()
+        time.sleep(self.latency)
+        for rate, error in (
+            (self.failure_rate, ConnectionError("stub backend: injected failure")),
+            (self.throttle_rate, BackendError("stub backend: 429 quota exceeded", 429, self.retry_after)),
+            (self.fatal_rate, BackendError("stub backend: 400 invalid request", 400)),
+            (self.empty_rate, None),
+        ):
+            if roll < rate:
+                if error is None:
+                    return None
+                raise error
+            roll -= rate
+        ref = hashlib.sha256(reference_bytes).hexdigest() if reference_bytes is not None else ""
+        return render_synthetic(text + ref, self.size)
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+def request_text(prompt: str, with_reference: bool = False) -> str:
+    """The text sent to the backend (and hashed into the response cache key) for prompt."""
+    text = STYLE_PREFIX + prompt
+    if with_reference:
+        text = "Generate an image of the same character in a new pose. " + text
+    return text
+
+
+def generate_image(
+    backend: ImageBackend | None,
+    prompt: str,
+    reference_bytes=None,
+    limiter: TokenBucket | None = None,
+    stats: RunStats | None = None,
+    asset: str = "",
+    cache: ResponseCache | None = None,
+    retry: RetryPolicy | None = None,
+):
+    """Ask the backend for an image. Returns (PIL Image, raw PNG bytes).
+    reference_bytes should be raw PNG bytes for style consistency. If a
+    limiter is given, every API attempt (including retries) takes a token.
+    API latency, retries and back-off are recorded against `asset` in stats.
+    With a cache, identical requests are answered locally; backend may then
+    be None to replay offline.
+
+    Failed calls are retried per `retry` (default: RetryPolicy()) when
+    is_retryable() allows it and re-raised at once otherwise. An answer
+    without an image is retried straight away: the service is up, so
+    neither back-off nor the circuit breaker applies."""
+    from PIL import Image
+
+    if stats is None:
+        stats = RunStats(Path("."))
+
+    text = request_text(prompt, reference_bytes is not None)
+
+    cache_key = None
+    if cache is not None:
+        cache_key = ResponseCache.key(backend.model if backend else MODEL, text, reference_bytes)
+        raw = cache.get(cache_key)
+        if raw is not None:
+            stats.add(asset, "cache_hits")
+            stats.set(asset, "response_bytes", len(raw))
+            print("  Cache hit")
+            return Image.open(io.BytesIO(raw)), raw
+    if backend is None:
+        raise RuntimeError("response not cached and no backend available")
+
+    if retry is None:
+        retry = RetryPolicy()
+    breaker = retry.breaker
+
+    for attempt in range(1, retry.max_attempts + 1):
+        if attempt > 1:
+            stats.add(asset, "retries")
+        if breaker is not None:
+            stats.add(asset, "breaker_wait_seconds", breaker.wait())
+        if limiter is not None:
+            stats.add(asset, "rate_limit_wait_seconds", limiter.acquire())
+        stats.add(asset, "api_calls")
+        try:
+            with stats.timed(asset, "api_seconds"):
+                raw = backend.generate(text, reference_bytes)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(False)
+            if not is_retryable(e):
+                stats.add(asset, "fatal_errors")
+                print(f"  Fatal error (attempt {attempt}/{retry.max_attempts}): {e}")
+                raise
+            stats.add(asset, "api_errors")
+            print(f"  Error (attempt {attempt}/{retry.max_attempts}): {e}")
+            hint = getattr(e, "retry_after", None)
+            if hint is not None and breaker is not None:
+                breaker.pause(hint)
+            if attempt < retry.max_attempts:
+                with stats.timed(asset, "backoff_seconds"):
+                    time.sleep(retry.delay(attempt, hint))
+            continue
+
+        if breaker is not None:
+            breaker.record(True)
+        if raw is not None:
+            stats.set(asset, "response_bytes", len(raw))
+            if cache is not None:
+                cache.put(cache_key, raw)
+            return Image.open(io.BytesIO(raw)), raw
+
+        stats.add(asset, "empty_responses")
+        print(f"  Warning: no image in response (attempt {attempt})")
+
+    raise RuntimeError(f"Failed to generate image after {retry.max_attempts} attempts")
+
+
+def _generate_one(
+    backend: ImageBackend | None,
+    rel_path: str,
+    prompt: str,
+    out_path: Path,
+    label: str,
+    reference_bytes=None,
+    limiter: TokenBucket | None = None,
+    on_saved: Callable[[Path], None] | None = None,
+    save_raw: Callable[[Path, bytes], None] | None = None,
+    stats: RunStats | None = None,
+    cache: ResponseCache | None = None,
+    retry: RetryPolicy | None = None,
+) -> bytes:
+    """Generate and save a single image. Returns the raw response bytes."""
+    print(f"\n{label} Generating: {rel_path}")
+    print(f"  Prompt: {prompt[:80]}...")
+
+    if stats is None:
+        stats = RunStats(Path("."))
+
+    img, raw_bytes = generate_image(
+        backend, prompt, reference_bytes=reference_bytes, limiter=limiter, stats=stats, asset=rel_path,
+        cache=cache, retry=retry,
+    )
+    if save_raw is not None:
+        save_raw(out_path, raw_bytes)
+        print(f"  Queued: {out_path} ({len(raw_bytes) / 1024:.1f} KB raw)")
+        return raw_bytes
+
+    with stats.timed(rel_path, "decode_seconds"):
+        img.load()
+    with stats.timed(rel_path, "save_seconds"):
+        img.save(str(out_path))
+    remove_variants(out_path)
+    stats.set(rel_path, "bytes_written", out_path.stat().st_size)
+    print(f"  Saved: {out_path} ({out_path.stat().st_size / 1024:.1f} KB)")
+    if on_saved is not None:
+        on_saved(out_path)
+    return raw_bytes
+
+
+def generate_group(
+    backend: ImageBackend | None,
+    items: list[tuple[str, str]],
+    root: Path,
+    group_name: str,
+    use_reference: bool = False,
+    concurrency: int = 1,
+    limiter: TokenBucket | None = None,
+    on_saved: Callable[[Path], None] | None = None,
+    save_raw: Callable[[Path, bytes], None] | None = None,
+    stats: RunStats | None = None,
+    manifest: dict[str, str] | None = None,
+    journal: JobJournal | None = None,
+    include: set[str] | None = None,
+    cache: ResponseCache | None = None,
+    retry: RetryPolicy | None = None,
+    aliases: dict[str, str] | None = None,
+) -> list[str]:
+    """Generate a group of images. If use_reference, the first image is used
+    as a reference for subsequent ones (mascot consistency).
+
+    Up to `concurrency` requests run at once on a thread pool; `limiter`
+    paces the API calls (defaults to REQUESTS_PER_SECOND). on_saved is
+    called with each newly written file; if save_raw is given it takes over
+    writing the raw response bytes instead. Timings go to stats, if given.
+
+    Images are (re)generated when missing or when their manifest entry no
+    longer matches the current inputs; manifest is updated in place. If
+    include is given, only those assets are considered. Aliased assets are
+    never generated, and ones marked STALE_DUPLICATE bypass the cache.
+
+    A failed image does not stop the rest of the group. Returns the failed
+    asset paths; each state change is written to journal, if given. cache
+    and retry are passed through to generate_image; share one RetryPolicy
+    across groups so its circuit breaker sees every call."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    print(f"\n{'='*60}")
+    print(f"Generating {group_name} ({len(items)} images)")
+    print(f"{'='*60}")
+
+    if limiter is None:
+        limiter = TokenBucket(REQUESTS_PER_SECOND)
+
+    reference_bytes = None
+    pending: list[tuple[int, str, str, Path]] = []
+
+    if manifest is None:
+        manifest = {}
+    plan = plan_group(items, root, manifest, use_reference, aliases)
+    duplicates = {rel_path for rel_path, _ in items if manifest.get(rel_path) == STALE_DUPLICATE}
+    input_hashes = {rel_path: input_hash for rel_path, input_hash, _ in plan}
+
+    if journal is None:
+        journal = JobJournal(Path(os.devnull))
+    failed: list[str] = []
+
+    def run_one(i: int, rel_path: str, prompt: str, out_path: Path, ref=None) -> bytes | None:
+        journal.record(rel_path, "in-flight")
+        try:
+            raw = _generate_one(
+                backend, rel_path, prompt, out_path, f"[{i+1}/{len(items)}]",
+                reference_bytes=ref, limiter=limiter, on_saved=on_saved, save_raw=save_raw, stats=stats,
+                cache=None if rel_path in duplicates else cache, retry=retry,
+            )
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            print(f"\n[{i+1}/{len(items)}] FAILED: {rel_path}: {error}")
+            journal.record(rel_path, "failed", error)
+            failed.append(rel_path)
+            return None
+        manifest[rel_path] = input_hashes[rel_path]
+        journal.record(rel_path, "done")
+        return raw
+
+    for i, ((rel_path, prompt), (_, input_hash, status)) in enumerate(zip(items, plan)):
+        out_path = root / rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if status == "ok" or (include is not None and rel_path not in include):
+            print(f"\n[{i+1}/{len(items)}] SKIP (up to date): {rel_path}")
+            if status == "ok":
+                manifest[rel_path] = input_hash
+                journal.record(rel_path, "done")
+            # If this is the first mascot, load its bytes as reference
+            shared = root / (aliases or {}).get(rel_path, rel_path)
+            if use_reference and i == 0:
+                # Prefer its raw response: dependents were generated (and cached)
+                # against those bytes, not against the compressed file on disk
+                if cache is not None and rel_path not in duplicates:
+                    model = backend.model if backend else MODEL
+                    reference_bytes = cache.get(ResponseCache.key(model, request_text(prompt)))
+                if reference_bytes is None and shared.exists():
+                    reference_bytes = shared.read_bytes()
+            continue
+        if status == "changed":
+            print(f"\n[{i+1}/{len(items)}] STALE (inputs changed): {rel_path}")
+
+        # The reference image must exist before anything depending on it starts
+        if use_reference and i == 0:
+            reference_bytes = run_one(i, rel_path, prompt, out_path)
+            continue
+
+        pending.append((i, rel_path, prompt, out_path))
+
+    if use_reference and reference_bytes is None and pending:
+        # Without the reference the rest would drift off-model; leave them for --resume
+        for i, rel_path, _, _ in pending:
+            print(f"\n[{i+1}/{len(items)}] FAILED: {rel_path}: reference image unavailable")
+            journal.record(rel_path, "failed", "reference image unavailable")
+            failed.append(rel_path)
+        return failed
+
+    ref = reference_bytes if use_reference else None
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for future in [pool.submit(run_one, *job, ref=ref) for job in pending]:
+            future.result()
+    return failed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate app images via Gemini API")
+    parser.add_argument("--api-key", help="Gemini API key (or set GEMINI_API_KEY env var)")
+    parser.add_argument(
+        "--only",
+        choices=["categories", "characters", "mascots", "scenarios"],
+        help="Generate only one group",
+    )
+    parser.add_argument(
+        "--compress-only",
+        action="store_true",
+        help="Skip generation, just compress existing PNGs",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for compression (default: 1)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompress every image, ignoring the compression cache",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of generation requests in flight at once (default: 1)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=REQUESTS_PER_SECOND,
+        help=f"Max API requests per second across all workers (default: {REQUESTS_PER_SECOND})",
+    )
+    parser.add_argument(
+        "--two-step",
+        action="store_true",
+        help="Save full-size PNGs first and compress them from disk (default: compress in memory)",
+    )
+    parser.add_argument(
+        "--variants",
+        action="store_true",
+        help="Also emit Flutter 1.0x/2.0x/3.0x density variants after compression",
+    )
+    parser.add_argument(
+        "--webp",
+        action="store_true",
+        help="With --variants, also write a lossless WebP next to each variant",
+    )
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="While compressing, search palette size/method/dither per image for the smallest PNG "
+        "within --max-error of the unquantized image",
+    )
+    parser.add_argument(
+        "--max-error",
+        type=float,
+        default=MAX_PERCEPTUAL_ERROR,
+        help=f"Perceptual error budget for --optimize, as 1 - SSIM (default: {MAX_PERCEPTUAL_ERROR})",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Where to write the JSON run report (default: run-<timestamp>.json in tools/reports, or reports/ under --root)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List images whose inputs are missing or changed, without generating anything",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check asset headers, byte budgets and app_images.dart without generating anything",
+    )
+    parser.add_argument(
+        "--max-file-kb",
+        type=int,
+        default=MAX_FILE_BYTES // 1024,
+        help=f"--verify budget per file (default: {MAX_FILE_BYTES // 1024})",
+    )
+    parser.add_argument(
+        "--max-total-kb",
+        type=int,
+        default=MAX_TOTAL_BYTES // 1024,
+        help=f"--verify budget for all images together (default: {MAX_TOTAL_BYTES // 1024})",
+    )
+    parser.add_argument(
+        "--trim",
+        action="store_true",
+        help="While compressing, make the white background transparent and crop to the content",
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="After compression, report near-duplicate images and share byte-identical ones",
+    )
+    parser.add_argument(
+        "--regenerate-duplicates",
+        action="store_true",
+        help="With --dedup, regenerate all but the first image of each near-duplicate cluster",
+    )
+    parser.add_argument(
+        "--max-distance",
+        type=int,
+        default=DEDUP_MAX_DISTANCE,
+        help=f"--dedup Hamming distance (of 64 bits) for near duplicates (default: {DEDUP_MAX_DISTANCE})",
+    )
+    parser.add_argument(
+        "--atlas",
+        nargs="+",
+        choices=["categories", "characters", "mascots", "scenarios"],
+        help="After compression, pack these groups into sprite atlases plus a Dart index",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Shrink images before converting them and free intermediates early",
+    )
+    parser.add_argument(
+        "--max-decodes",
+        type=int,
+        help="Cap full-resolution decodes in flight across all compression workers",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Only retry assets left pending, in-flight or failed by the previous run's journal",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of replaying cached responses",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Response cache directory (default: tools/.response_cache, or .response_cache under --root)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["gemini", "stub"],
+        default="gemini",
+        help="Image backend; 'stub' renders synthetic images offline for load tests",
+    )
+    parser.add_argument("--stub-latency", type=float, default=1.0, help="Seconds per stub request (default: 1.0)")
+    parser.add_argument(
+        "--stub-failure-rate", type=float, default=0.0, help="Share of stub requests that raise (default: 0)"
+    )
+    parser.add_argument(
+        "--stub-throttle-rate",
+        type=float,
+        default=0.0,
+        help="Share of stub requests rejected with 429 and a retry-after hint (default: 0)",
+    )
+    parser.add_argument(
+        "--stub-fatal-rate",
+        type=float,
+        default=0.0,
+        help="Share of stub requests rejected with a non-retryable 400 (default: 0)",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        help="Project root to write into (default: the repo; a temp dir with --backend stub)",
+    )
+    args = parser.parse_args()
+
+    # Resolve project root (script lives in tools/)
+    project_root = Path(__file__).resolve().parent.parent
+    if args.root:
+        root = args.root.resolve()
+    elif args.backend == "stub":
+        # Never let synthetic images overwrite the real assets
+        import tempfile
+
+        root = Path(tempfile.mkdtemp(prefix="stub-assets-"))
+        print(f"Stub backend: writing to {root}")
+    else:
+        root = project_root
+    # Bookkeeping for any other root (manifest, journal, caches, reports) lives
+    # inside it, away from the real lockfile
+    manifest_path = MANIFEST if root == project_root else root / MANIFEST.name
+    journal_path = JOURNAL if root == project_root else root / JOURNAL.name
+    compress_cache = COMPRESS_CACHE if root == project_root else root / COMPRESS_CACHE.name
+    aliases_path = ALIASES if root == project_root else root / ALIASES.name
+    reports_dir = REPORTS_DIR if root == project_root else root / REPORTS_DIR.name
+    cache_dir = args.cache_dir or (RESPONSE_CACHE_DIR if root == project_root else root / RESPONSE_CACHE_DIR.name)
+    aliases = load_aliases(aliases_path)
+    stats = RunStats(root)
+    max_error = args.max_error if args.optimize else None
+    groups = {
+        "categories": (CATEGORIES, "Categories", False),
+        "characters": (CHARACTERS, "Characters", False),
+        "mascots": (MASCOTS, "Mascots (with reference)", True),
+        "scenarios": (SCENARIOS, "Scenarios", False),
+    }
+
+    all_items = CATEGORIES + CHARACTERS + MASCOTS + SCENARIOS
+
+    if args.verify:
+        problems = verify_assets(
+            root, all_items, args.max_file_kb * 1024, args.max_total_kb * 1024, aliases=aliases
+        )
+        sys.exit(1 if problems else 0)
+
+    if args.compress_only:
+        compress_all(
+            root / "assets" / "images", jobs=args.jobs, force=args.force, cache_path=compress_cache,
+            stats=stats, low_memory=args.low_memory, max_decodes=args.max_decodes, trim=args.trim,
+            max_error=max_error,
+        )
+        if args.dedup:
+            manifest = load_manifest(manifest_path)
+            stale = dedup_assets(
+                root, all_items, manifest, aliases, jobs=args.jobs, max_distance=args.max_distance,
+                regenerate=args.regenerate_duplicates,
+            )
+            save_aliases(aliases, aliases_path)
+            save_manifest(manifest, manifest_path)
+            if stale:
+                print("Run again without --compress-only to regenerate them.")
+        if args.variants:
+            build_variants(
+                root / "assets" / "images", jobs=args.jobs, webp=args.webp, force=args.force,
+                cache_path=compress_cache, trim=args.trim, max_error=max_error,
+            )
+        if args.atlas:
+            build_atlases(root, {key: groups[key][0] for key in args.atlas})
+        # Last, so sizes and placeholders describe the files that actually ship
+        write_image_meta(root, all_items)
+        rss = peak_rss_kb()
+        if rss:
+            print(f"\nPeak RSS: {rss['self'] / 1024:.0f} MB main, {rss['children'] / 1024:.0f} MB largest worker")
+        print(f"Run report: {stats.write(args.report, reports_dir)}")
+        return
+
+    keys = [args.only] if args.only else ["categories", "characters", "mascots", "scenarios"]
+    manifest = load_manifest(manifest_path)
+
+    if args.dry_run:
+        rebuild = 0
+        for key in keys:
+            items, name, use_ref = groups[key]
+            for rel_path, _, status in plan_group(items, root, manifest, use_ref, aliases):
+                if status != "ok":
+                    rebuild += 1
+                    print(f"  {status:8} {rel_path}")
+        print(f"\n{rebuild} image(s) would be generated")
+        return
+
+    cache = None if args.no_cache else ResponseCache(cache_dir)
+
+    # Resolve backend (and API key)
+    api_key = args.api_key or os.environ.get("GEMINI_API_KEY")
+    if args.backend == "stub":
+        backend = StubBackend(
+            latency=args.stub_latency, failure_rate=args.stub_failure_rate,
+            throttle_rate=args.stub_throttle_rate, fatal_rate=args.stub_fatal_rate,
+        )
+    elif api_key:
+        backend = GeminiBackend(api_key)
+    elif cache is not None:
+        print(f"No API key: replaying from {cache.directory} only")
+        backend = None
+    else:
+        print("Error: provide --api-key or set GEMINI_API_KEY env var")
+        sys.exit(1)
+    # One bucket and one breaker for the whole run so limits hold across groups
+    limiter = TokenBucket(args.rate)
+    breaker = CircuitBreaker()
+    retry = RetryPolicy(breaker=breaker)
+
+    if args.resume:
+        journal = JobJournal(journal_path)
+        include = journal.unfinished()
+        if not include:
+            print("Nothing to resume: the journal has no pending or failed assets.")
+            return
+        print(f"Resuming {len(include)} unfinished asset(s) from {journal.path.name}")
+    else:
+        journal = JobJournal(journal_path, fresh=True)
+        include = None
+        for key in keys:
+            items, _, use_ref = groups[key]
+            for rel_path, _, status in plan_group(items, root, manifest, use_ref, aliases):
+                if status != "ok":
+                    journal.record(rel_path, "pending")
+
+    def generate_round(include: set[str] | None) -> tuple[list[str], list[Path]]:
+        """Generate the selected groups once. Returns (failed assets, generated files)."""
+        # Newly generated files are compressed in the background while the
+        # next API calls are in flight; existing images are left alone.
+        pipeline = CompressionPipeline(
+            jobs=args.jobs, force=args.force, cache_path=compress_cache, stats=stats,
+            low_memory=args.low_memory, max_decodes=args.max_decodes, trim=args.trim, max_error=max_error,
+        )
+        # By default raw API bytes go straight to the workers and only the final
+        # PNG hits the disk; --two-step keeps the full-size intermediate file.
+        on_saved = pipeline.submit if args.two_step else None
+        save_raw = None if args.two_step else pipeline.submit_bytes
+        failed: list[str] = []
+        try:
+            for key in keys:
+                items, name, use_ref = groups[key]
+                failed += generate_group(
+                    backend, items, root, name, use_reference=use_ref,
+                    concurrency=args.concurrency, limiter=limiter,
+                    on_saved=on_saved, save_raw=save_raw, stats=stats, manifest=manifest,
+                    journal=journal, include=include, cache=cache, retry=retry, aliases=aliases,
+                )
+        finally:
+            # Only successfully generated assets were recorded, so failures stay stale
+            save_manifest(manifest, manifest_path)
+            generated = pipeline.finish()
+        return failed, generated
+
+    try:
+        failed, generated = generate_round(include)
+        if args.dedup:
+            stale = dedup_assets(
+                root, all_items, manifest, aliases, jobs=args.jobs, max_distance=args.max_distance,
+                regenerate=args.regenerate_duplicates,
+            )
+            save_aliases(aliases, aliases_path)
+            save_manifest(manifest, manifest_path)
+            if stale:
+                # One more round only; anything still similar shows up in the next report
+                print(f"\nRegenerating {len(stale)} near duplicate(s)...")
+                for rel_path in stale:
+                    journal.record(rel_path, "pending")
+                more_failed, more_generated = generate_round(set(stale))
+                failed += more_failed
+                generated += more_generated
+    finally:
+        report_path = stats.write(args.report, reports_dir)
+
+    if args.variants:
+        build_variants(
+            root / "assets" / "images", jobs=args.jobs, webp=args.webp, force=args.force,
+            cache_path=compress_cache, trim=args.trim, max_error=max_error,
+        )
+    if args.atlas:
+        build_atlases(root, {key: groups[key][0] for key in args.atlas})
+    # Last, so sizes and placeholders describe the files that actually ship
+    write_image_meta(root, all_items)
+
+    # Summary
+    pngs = list((root / "assets" / "images").rglob("*.png"))
+    print(f"\n{'='*60}")
+    print(f"Done! {len(generated)} images generated, {len(pngs)} in assets.")
+    total_kb = sum(p.stat().st_size for p in pngs) / 1024
+    print(f"Total size: {total_kb:.1f} KB")
+    totals = stats.report()["totals"]
+    print(
+        f"API: {totals.get('api_seconds', 0):.1f}s over {int(totals.get('api_calls', 0))} calls, "
+        f"{int(totals.get('retries', 0))} retries, {totals.get('backoff_seconds', 0):.1f}s backing off"
+    )
+    if breaker.trips:
+        print(
+            f"Circuit breaker: opened {breaker.trips} time(s), "
+            f"{totals.get('breaker_wait_seconds', 0):.1f}s paused across workers"
+        )
+    print(f"Run report: {report_path}")
+    print(f"{'='*60}")
+
+    if failed:
+        print(f"\n{len(failed)} image(s) failed:")
+        for rel_path in failed:
+            print(f"  {rel_path}: {journal.states()[rel_path].get('error', '')}")
+        print("Re-run with --resume to retry them.")
+        sys.exit(1)
 
 
 if __name__ == "__main__":